@@ -0,0 +1,85 @@
+# Benchmark: Database (one long-lived connection, write-behind queue) vs. a connection per call
+# Saves the same giveaway row repeatedly and loads it back by id. The baseline opens an aiosqlite connection for
+# every statement and commits each save, as Database did before it kept its connection; the database lives in a
+# temporary directory, so numbers depend on the local disk.
+#
+#   python scripts/bench_db.py [--ops 300]
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import aiosqlite
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.database import Database  # noqa: E402
+
+SAVE = """
+    INSERT INTO giveaways (custom_id, prize, end_time, channel_id, message_id, entries, is_ended)
+    VALUES (?, ?, ?, ?, ?, '[]', 0)
+    ON CONFLICT(custom_id) DO UPDATE SET prize = excluded.prize, end_time = excluded.end_time
+"""
+LOAD = "SELECT * FROM giveaways WHERE custom_id = ?"
+
+
+async def per_call(path: Path, ops: int, end_time: datetime):
+    started = time.perf_counter()
+    for i in range(ops):
+        async with aiosqlite.connect(path) as db:
+            await db.execute(SAVE, ("bench", f"prize {i}", end_time.isoformat(), 1, 2))
+            await db.commit()
+    save = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(ops):
+        async with aiosqlite.connect(path) as db:
+            async with db.execute(LOAD, ("bench",)) as cursor:
+                await cursor.fetchone()
+    load = time.perf_counter() - started
+    return save, load
+
+
+async def long_lived(db: Database, ops: int, end_time: datetime):
+    # Saves are queued; the final flush is included so every write is on disk
+    started = time.perf_counter()
+    for i in range(ops):
+        await db.save_giveaway("bench", f"prize {i}", end_time, 1, 2)
+    await db.flush()
+    save = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(ops):
+        await db.load_giveaway("bench", include_ended=True)
+    load = time.perf_counter() - started
+    return save, load
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark Database against a connection per call")
+    parser.add_argument("--ops", type=int, default=300)
+    args = parser.parse_args()
+
+    end_time = datetime.utcnow() + timedelta(days=1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.db"
+        db = Database(path)
+        await db.initialize()
+        try:
+            results = {
+                "connection per call": await per_call(path, args.ops, end_time),
+                "long-lived connection": await long_lived(db, args.ops, end_time),
+            }
+        finally:
+            await db.close()
+
+    print(f"{args.ops} ops")
+    for label, (save, load) in results.items():
+        print(f"  {label:<22} save {save / args.ops * 1000:.2f} ms/op, load {load / args.ops * 1000:.2f} ms/op")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+# Benchmark: EntryPool draws over a large giveaway
+# 100k entrants (10% at weight 3 by default): a plain draw, a draw where accept() rejects every entrant (e.g. the
+# member cache isn't chunked yet), one where it accepts 1%, and drawing every entrant. Also checks that weights
+# are honoured on a small pool.
+#
+#   python scripts/bench_draw.py [--entrants 100000] [--winners 5]
+import argparse
+import collections
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.draw import EntryPool  # noqa: E402
+
+
+def timed(label: str, draw):
+    started = time.perf_counter()
+    winners = draw()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<32} {elapsed * 1000:9.3f} ms, {len(winners)} winner(s)")
+    return winners
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EntryPool draws")
+    parser.add_argument("--entrants", type=int, default=100_000)
+    parser.add_argument("--winners", type=int, default=5)
+    args = parser.parse_args()
+
+    pool = EntryPool.from_weights({i: 3 if i % 10 == 0 else 1 for i in range(args.entrants)})
+    print(f"{args.entrants} entrants, {args.winners} winners")
+
+    timed(f"draw({args.winners})", lambda: pool.draw(args.winners))
+    timed("draw(1), every entrant rejected", lambda: pool.draw(1, accept=lambda user_id: False))
+    winners = timed(
+        f"draw({args.winners}), 1% accepted", lambda: pool.draw(args.winners, accept=lambda user_id: user_id % 100 == 0)
+    )
+    assert all(user_id % 100 == 0 for user_id in winners)
+    winners = timed("draw(all)", lambda: pool.draw(args.entrants))
+    assert len(set(winners)) == args.entrants
+
+    # Entrant 3 has twice the weight of entrant 1; entrant 2 is excluded
+    small = EntryPool.from_weights({1: 1, 2: 1, 3: 2})
+    counts = collections.Counter(small.draw(1, exclude={2})[0] for _ in range(30_000))
+    print(f"  weights 1:2 drawn as {counts[1]}:{counts[3]} (ratio {counts[3] / counts[1]:.2f}), excluded drawn {counts[2]}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Benchmark: streaming ICS parsing (IcsEventParser) vs. parsing the whole decoded document at once
+# Builds a synthetic feed (folded descriptions, VALARMs, TZID start times) and feeds it the way FeedFetcher does:
+# raw chunks through an incremental UTF-8 decoder. The baseline is the previous approach: decode the whole body,
+# unfold it, split on BEGIN:VEVENT and parse each block with strptime. Reports time, throughput and peak memory.
+#
+#   python scripts/bench_ics.py [--events 50000] [--chunk-size 65536] [--runs 3]
+import argparse
+import codecs
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.ics import IcsEventParser  # noqa: E402
+
+
+def make_feed(events: int) -> bytes:
+    parts = ["BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"]
+    for i in range(events):
+        parts.append(
+            f"BEGIN:VEVENT\r\n"
+            f"UID:event-{i}@example.com\r\n"
+            f"SUMMARY:Synthetic event number {i} with a reasonably long title\r\n"
+            f"DTSTART;TZID=America/Phoenix:2030{i % 12 + 1:02d}{i % 28 + 1:02d}T1{i % 10}0000\r\n"
+            f"LOCATION:Room {i % 100}\r\n"
+            f"DESCRIPTION:Line one of the description for {i}\\nline two which is long enough to be folded acro\r\n"
+            f" ss a continuation line per RFC 5545\r\n"
+            f"BEGIN:VALARM\r\nACTION:DISPLAY\r\nDESCRIPTION:alarm\r\nEND:VALARM\r\n"
+            f"END:VEVENT\r\n"
+        )
+    parts.append("END:VCALENDAR\r\n")
+    return "".join(parts).encode()
+
+
+def parse_whole(body: bytes, chunk_size: int, keep: bool):
+    # Baseline: the whole body as one string, unfolded, split into blocks
+    lines: List[str] = []
+    for line in body.decode("utf-8").splitlines():
+        if line[:1] in (" ", "\t") and lines:
+            lines[-1] += line[1:]
+        else:
+            lines.append(line)
+    events: List[Dict[str, object]] = []
+    for block in "\n".join(lines).split("BEGIN:VEVENT"):
+        if "END:VEVENT" not in block:
+            continue
+        event: Dict[str, object] = {}
+        start: Optional[datetime] = None
+        for raw in block.splitlines():
+            line = raw.strip()
+            name, _, value = line.partition(":")
+            if name in ("SUMMARY", "UID", "LOCATION", "DESCRIPTION", "URL"):
+                event[name.lower()] = value.strip()
+            elif name.startswith("DTSTART"):
+                tzid = next((p[5:] for p in name.split(";")[1:] if p.startswith("TZID=")), None)
+                start = datetime.strptime(value.strip(), "%Y%m%dT%H%M%S")
+                start = start.replace(tzinfo=ZoneInfo(tzid) if tzid else timezone.utc).astimezone(timezone.utc)
+        if start is not None:
+            event["start"] = start
+            events.append(event)
+    return events if keep else len(events)
+
+
+def parse_streaming(body: bytes, chunk_size: int, keep: bool):
+    # IcsEventParser fed decoded chunks, as FeedFetcher.fetch does
+    parser = IcsEventParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    events: List[Dict[str, object]] = []
+    count = 0
+    for offset in range(0, len(body), chunk_size):
+        completed = parser.feed(decoder.decode(body[offset:offset + chunk_size]))
+        count += len(completed)
+        if keep:
+            events.extend(completed)
+    completed = parser.feed(decoder.decode(b"", final=True)) + parser.close()
+    count += len(completed)
+    if keep:
+        events.extend(completed)
+    return events if keep else count
+
+
+def measure(parse: Callable, body: bytes, chunk_size: int, keep: bool, runs: int):
+    # Best of runs wall time, then one traced run for peak memory
+    times = []
+    for _ in range(runs):
+        gc.collect()
+        started = time.perf_counter()
+        parse(body, chunk_size, keep)
+        times.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    result = parse(body, chunk_size, keep)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return min(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs. whole-document ICS parsing")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    body = make_feed(args.events)
+    count = parse_streaming(body, args.chunk_size, keep=False)
+    print(f"{args.events} events ({count} parsed), {len(body) / 1e6:.1f} MB, {args.chunk_size // 1024} KiB chunks")
+
+    cases = [
+        ("whole document, events counted only", parse_whole, False),
+        ("whole document, events kept", parse_whole, True),
+        ("streaming, events counted only", parse_streaming, False),
+        ("streaming, events kept", parse_streaming, True),
+    ]
+    for label, parse, keep in cases:
+        seconds, peak = measure(parse, body, args.chunk_size, keep, args.runs)
+        print(f"  {label:<38} {seconds * 1000:7.0f} ms ({len(body) / 1e6 / seconds:5.1f} MB/s), peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,103 @@
 from __future__ import annotations
 import asyncio
+import bisect
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Set, Optional, Dict
-from zoneinfo import ZoneInfo
+from typing import Hashable, List, Optional, Dict
 
-import aiohttp
 import discord
 from discord.ext import commands, tasks
 
 from ..config import Config
+from ..utils.database import Database
+from ..utils.feed import FeedFetcher
+from ..utils.ics import IcsEventParser
+from ..utils.recurrence import RecurrenceExpander, window_start
+from ..utils.scheduler import DeadlineScheduler
 
 logger = logging.getLogger("bot.calendar")
 
+# Reminders post this long before an event starts
+REMINDER_OFFSET = timedelta(minutes=60)
+# A reminder whose time passed less than this long ago still posts (e.g. right after a restart)
+REMINDER_GRACE = timedelta(minutes=2)
+# Reminders are armed for events starting within this horizon; the horizon moves forward every minute
+REMINDER_HORIZON = timedelta(days=7)
+# Recurring events are expanded over a window from UTC midnight this far ahead (covers the arming horizon all day)
+RECURRENCE_LOOKAHEAD = REMINDER_HORIZON + timedelta(days=1)
+
+
+class EventIndex:
+    # Parsed events sorted by start time; range queries by start are a bisect
+    def __init__(self, events: List[Dict[str, object]]):
+        self.events = sorted(events, key=lambda event: event["start"])
+        self.starts = [event["start"] for event in self.events]
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def between(self, start: datetime, end: datetime) -> List[Dict[str, object]]:
+        # Events with start <= event start < end
+        return self.events[bisect.bisect_left(self.starts, start):bisect.bisect_left(self.starts, end)]
+
+
+class ReminderLedger:
+    # Posted reminders, persisted in SQLite (so restarts don't repost) with an in-memory front cache for O(1)
+    # membership checks. Entries are evicted once their event has started: no reminder can be due for it anymore.
+    def __init__(self, db: Database):
+        self.db = db
+        self._sent: Dict[str, datetime] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sent
+
+    def __len__(self) -> int:
+        return len(self._sent)
+
+    async def load(self, now: datetime):
+        await self.db.prune_calendar_reminders(now)
+        self._sent = await self.db.load_calendar_reminders(now)
+        logger.info(f"Loaded {len(self._sent)} posted calendar reminder(s)")
+
+    async def add(self, key: str, event_start: datetime):
+        # Recorded (and flushed) before the reminder is sent: a crash mid-send skips it rather than reposting
+        self._sent[key] = event_start
+        await self.db.save_calendar_reminder(key, event_start)
+        await self.db.flush()
+
+    async def prune(self, now: datetime) -> int:
+        self._sent = {key: start for key, start in self._sent.items() if start >= now}
+        return await self.db.prune_calendar_reminders(now)
+
 
 class CalendarCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.config: Config = bot.config  # type: ignore[attr-defined]
-        # Track sent 60‑minute reminders
-        self.posted_reminders: Set[str] = set()
+        # Sent 60‑minute reminders (loaded from the database before the first poll)
+        self.posted_reminders = ReminderLedger(bot.db)  # type: ignore[attr-defined]
+        # Conditional fetches of the ICS feed; events are only re-parsed when its body changes
+        self.feed = FeedFetcher(self.config.calendar_ics_url) if self.config.calendar_ics_url else None
+        # Events as parsed from the feed (recurring ones unexpanded), and their occurrences in the current window
+        self.events: List[Dict[str, object]] = []
+        self.recurrences = RecurrenceExpander()
+        self._window: Optional[datetime] = None
+        self.index = EventIndex([])
+        # Armed reminders (key -> event) and the start time up to which events have been armed
+        self._reminders: Dict[str, Dict[str, object]] = {}
+        self._armed_until: Optional[datetime] = None
+        self.reminder_scheduler = DeadlineScheduler(self._on_reminders_due, name="calendar-reminders")
+        self.reminder_scheduler.start()
         self._run_loop.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self._run_loop.cancel()
+        self.reminder_scheduler.stop()
+        if self.feed:
+            logger.info(f"Calendar feed stats: {self.feed.stats()}")
+            await self.feed.close()
 
-    # Check every minute to reliably hit the 60‑minute reminder window
+    # Poll the feed every minute; reminders themselves fire from reminder_scheduler at exactly T-60
     @tasks.loop(minutes=1)
     async def _run_loop(self):
         if not (self.config.calendar_ics_url and self.config.calendar_channel_id):
@@ -34,143 +106,93 @@ class CalendarCog(commands.Cog):
         if not isinstance(channel, (discord.TextChannel, discord.Thread)):
             return
 
+        # Events are parsed while the body streams in; a 304 or an identical body leaves the events parsed
+        # last time in place, and on a fetch error the last parsed events are used too
+        parser = IcsEventParser()
+        events: List[Dict[str, object]] = []
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.config.calendar_ics_url, timeout=30) as resp:
-                    if resp.status != 200:
-                        logger.warning(f"Calendar fetch failed: HTTP {resp.status}")
-                        return
-                    ics_text = await resp.text()
+            changed = await self.feed.fetch(lambda text: events.extend(parser.feed(text)))
+            if changed:
+                events.extend(parser.close())
         except Exception as e:
             logger.warning(f"Calendar fetch error: {e}")
-            return
-
-        # Unfold folded lines per RFC5545, then iterate events
-        ics_text = _unfold_ics(ics_text)
+            changed = False
         now = datetime.now(timezone.utc)
-        reminder_offset = timedelta(minutes=60)
-        window = timedelta(minutes=2)  # ±2 minutes around the target
-
-        for block in ics_text.split("BEGIN:VEVENT"):
-            if "END:VEVENT" not in block:
+        if changed:
+            self.events = events
+            self._rebuild_index(now)
+            logger.debug(f"Calendar feed changed: indexed {len(self.index)} occurrence(s), {len(self._reminders)} reminder(s) armed")
+        elif self._window is not None and window_start(now) != self._window:
+            # A new day: slide the recurrence window (unchanged events are served from the expansion cache)
+            self._rebuild_index(now)
+        elif self._armed_until is not None:
+            self._arm_reminders(now)
+        if self._run_loop.current_loop % 60 == 0:
+            pruned = await self.posted_reminders.prune(now)
+            logger.info(
+                f"Calendar feed stats: {self.feed.stats()}, recurrences: {self.recurrences.stats()}, "
+                f"reminders posted: {len(self.posted_reminders)} (pruned {pruned})"
+            )
+
+    def _rebuild_index(self, now: datetime):
+        self._window = window_start(now)
+        occurrences = self.recurrences.expand(self.events, self._window, self._window + RECURRENCE_LOOKAHEAD)
+        self.index = EventIndex(occurrences)
+        self._rearm_reminders(now)
+
+    def _rearm_reminders(self, now: datetime):
+        # The index was rebuilt: arm reminders from it, keeping timers of events that are still there
+        # and cancelling those of events that were removed or moved
+        previous = self._reminders
+        self._reminders = {}
+        self._armed_until = now + REMINDER_OFFSET - REMINDER_GRACE
+        self._arm_reminders(now, previous)
+        for key in previous.keys() - self._reminders.keys():
+            self.reminder_scheduler.cancel(key)
+
+    def _arm_reminders(self, now: datetime, previous: Optional[Dict[str, Dict[str, object]]] = None):
+        # Arm events that entered the horizon since the last call (a bisect plus the new events only)
+        horizon = now + REMINDER_HORIZON
+        for event in self.index.between(self._armed_until, horizon):
+            key = _reminder_key(event)
+            if key in self.posted_reminders:
                 continue
+            self._reminders[key] = event
+            if previous is None or key not in previous:
+                self.reminder_scheduler.schedule(key, max(event["start"] - REMINDER_OFFSET, now))
+        self._armed_until = horizon
 
-            try:
-                event = _parse_event_block(block)
-            except Exception as e:
-                logger.debug(f"Skip event parse error: {e}")
+    async def _on_reminders_due(self, keys: List[Hashable]):
+        channel = self.bot.get_channel(self.config.calendar_channel_id)
+        now = datetime.now(timezone.utc)
+        for key in keys:
+            event = self._reminders.pop(key, None)
+            if event is None or key in self.posted_reminders:
                 continue
-            if not event:
+            if event["start"] - now < REMINDER_OFFSET - REMINDER_GRACE:
+                logger.warning(f"Skipping late reminder for event: {event.get('summary','(No Title)')}")
                 continue
+            if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+                continue
+            await self.posted_reminders.add(key, event["start"])
 
-            start = event["start"]  # timezone‑aware UTC datetime
-            uid = event.get("uid") or event.get("summary") or "unknown"
-
-            # Fire exactly once around T-60 minutes
-            delta = (start - now)
-            if abs(delta - reminder_offset) <= window:
-                key = f"{uid}-{start.isoformat()}-60m"
-                if key in self.posted_reminders:
-                    continue
-                self.posted_reminders.add(key)
-
-                embed = _build_calendar_embed(event)
-                try:
-                    await channel.send(embed=embed)
-                    logger.info(f"Posted 60‑minute reminder for event: {event.get('summary','(No Title)')}")
-                except Exception as e:
-                    logger.error(f"Failed to send calendar reminder: {e}")
+            embed = _build_calendar_embed(event)
+            try:
+                await self.bot.edits.submit(channel.id, lambda: channel.send(embed=embed))
+                logger.info(f"Posted 60‑minute reminder for event: {event.get('summary','(No Title)')}")
+            except Exception as e:
+                logger.error(f"Failed to send calendar reminder: {e}")
 
     @_run_loop.before_loop
     async def _before_loop(self):
         await self.bot.wait_until_ready()
+        await self.posted_reminders.load(datetime.now(timezone.utc))
 
 
-def _unfold_ics(text: str) -> str:
-    # Join lines that start with a space or tab with the previous line
-    out: list[str] = []
-    for line in text.splitlines():
-        if line.startswith(" ") or line.startswith("\t"):
-            if out:
-                out[-1] += line[1:]
-            else:
-                out.append(line.lstrip())
-        else:
-            out.append(line)
-    return "\n".join(out)
-
-
-def _parse_event_block(block: str) -> Optional[Dict[str, object]]:
-    # Extract fields with simple param support (TZID, VALUE)
-    summary: Optional[str] = None
-    uid: Optional[str] = None
-    location: Optional[str] = None
-    description: Optional[str] = None
-    url: Optional[str] = None
-    start: Optional[datetime] = None
-
-    for raw in block.splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        if line.startswith("SUMMARY:"):
-            summary = line.split(":", 1)[1].strip()
-        elif line.startswith("UID:"):
-            uid = line.split(":", 1)[1].strip()
-        elif line.startswith("LOCATION:"):
-            location = line.split(":", 1)[1].strip()
-        elif line.startswith("DESCRIPTION:"):
-            description = line.split(":", 1)[1].strip().replace("\\n", "\n")
-        elif line.startswith("URL:"):
-            url = line.split(":", 1)[1].strip()
-        elif line.startswith("DTSTART"):
-            # DTSTART[:|;params]:value
-            try:
-                left, value = line.split(":", 1)
-            except ValueError:
-                continue
-            tzid: Optional[str] = None
-            all_day = False
-            if ";" in left:
-                for part in left.split(";")[1:]:
-                    if part.startswith("TZID="):
-                        tzid = part.split("=", 1)[1]
-                    elif part.startswith("VALUE=") and part.endswith("DATE"):
-                        all_day = True
-            # Skip all‑day events for reminders
-            if all_day:
-                continue
-            start = _parse_ics_datetime_with_tz(value.strip(), tzid)
-
-    if start is None:
-        return None
-
-    return {
-        "summary": summary or "(No Title)",
-        "uid": uid,
-        "location": location,
-        "description": description,
-        "url": url,
-        "start": start,
-    }
-
-
-def _parse_ics_datetime_with_tz(value: str, tzid: Optional[str]) -> datetime:
-    # Supports forms like 20250101T170000Z or 20250101T170000 with TZID
-    value = value.strip()
-    if value.endswith("Z"):
-        dt = datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
-        return dt
-    # Naive local time with TZID
-    dt = datetime.strptime(value, "%Y%m%dT%H%M%S")
-    if tzid:
-        try:
-            tz = ZoneInfo(tzid)
-        except Exception:
-            tz = timezone.utc
-        return dt.replace(tzinfo=tz).astimezone(timezone.utc)
-    # Assume UTC if no TZID
-    return dt.replace(tzinfo=timezone.utc)
+def _reminder_key(event: Dict[str, object]) -> str:
+    # One reminder per event occurrence (the start time is part of the key, so a moved event is reminded again)
+    uid = event.get("uid") or event.get("summary") or "unknown"
+    return f"{uid}-{event['start'].isoformat()}-60m"
 
 
 def _build_calendar_embed(event: Dict[str, object]) -> discord.Embed:
@@ -71,7 +71,7 @@ class CTFTimeCog(commands.Cog):
             embed.add_field(name="Starts", value=f"<t:{int(start_dt.timestamp())}:F>")
             if url:
                 embed.add_field(name="More info", value=url, inline=False)
-            await channel.send(embed=embed)
+            await self.bot.edits.submit(channel.id, lambda embed=embed: channel.send(embed=embed))
             self.posted_ids.add(ev_id)
 
     @_loop.before_loop
@@ -2,53 +2,142 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import random
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from ..utils.coalescer import UpdateCoalescer
 from ..utils.database import Database
+from ..utils.draw import EntryPool
+from ..utils.edit_scheduler import EditPriority, EditScheduler
+from ..utils.member_index import MemberRecord
+from ..utils.message_index import MessageIndex
+from ..utils.scheduler import DeadlineScheduler
 
 logger = logging.getLogger("bot.giveaway")
 
+# Max concurrent message fetches when validating restored giveaways after startup
+RESTORE_VALIDATE_CONCURRENCY = 5
 
-class GiveawayView(discord.ui.View):
-    def __init__(self, prize: str, end_time: datetime, giveaway_cog, custom_id: str):
-        super().__init__(timeout=None)  # Persistent view
-        self.entries: Set[int] = set()
+# Seconds before retrying the end of a giveaway whose message reference isn't available yet
+END_RETRY_DELAY = 30
+
+# Minimum seconds between entry-count edits of one giveaway message
+EMBED_UPDATE_WINDOW = 2.0
+
+# Channels whose ended giveaways are processed concurrently (each channel's endings run in order)
+ENDING_CONCURRENCY = 4
+
+# Giveaways per /giveaway_history page
+HISTORY_PAGE_SIZE = 10
+
+# Upper bound on winners per draw (keeps announcements within one message)
+MAX_WINNERS = 20
+
+# "<@&role>=weight" / "role_id:weight" pairs accepted by /giveaway_start role_weights
+ROLE_WEIGHT_PATTERN = re.compile(r"(?:<@&)?(\d+)>?\s*[=:]\s*(\d+)")
+
+
+def parse_role_weights(raw: Optional[str]) -> Dict[int, int]:
+    # Parse "@Role=3, @Other=2" (as role mentions or ids) into {role_id: weight}
+    if not raw:
+        return {}
+    weights = {int(role_id): int(weight) for role_id, weight in ROLE_WEIGHT_PATTERN.findall(raw)}
+    if not weights or any(weight < 1 for weight in weights.values()):
+        raise ValueError("Role weights must look like `@Role=3, @Other=2` with weights of at least 1.")
+    return weights
+
+
+class GiveawayEnterButton(discord.ui.DynamicItem[discord.ui.Button], template=r"giveaway_enter(?::(?P<giveaway_id>[A-Za-z0-9_]+))?"):
+    # Enter button whose custom_id carries the giveaway id, so any click is routed without a resident view.
+    # The bare legacy id "giveaway_enter" (pre-dynamic messages) also matches and is resolved by message id.
+    def __init__(self, giveaway_id: Optional[str] = None):
+        custom_id = f"giveaway_enter:{giveaway_id}" if giveaway_id else "giveaway_enter"
+        super().__init__(
+            discord.ui.Button(
+                label="Enter Giveaway",
+                style=discord.ButtonStyle.success,
+                emoji="🎉",
+                custom_id=custom_id,
+            )
+        )
+        self.giveaway_id = giveaway_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["giveaway_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("GiveawayCog")
+        if cog is None:
+            await interaction.response.send_message("Giveaways are unavailable right now.", ephemeral=True)
+            return
+        await cog.handle_entry(interaction, self.giveaway_id)
+
+
+class Giveaway:
+    # In-memory state of an active giveaway (no discord.ui.View; the button routes by custom_id)
+    def __init__(
+        self,
+        prize: str,
+        end_time: datetime,
+        custom_id: str,
+        winner_count: int = 1,
+        role_weights: Optional[Dict[int, int]] = None,
+        requirements: Optional[Dict[str, Any]] = None
+    ):
+        self.entries = EntryPool()
         self.prize = prize
+        self.winner_count = winner_count
+        # role_id -> number of entries a member with that role gets (highest applicable weight wins)
+        self.role_weights: Dict[int, int] = role_weights or {}
+        self.winners: List[int] = []
+        # Entry requirements: required_role_id, verified_role_id, min_member_days (all optional)
+        self.requirements: Dict[str, Any] = requirements or {}
         # Normalize end_time to UTC-aware to keep timestamp rendering correct across hosts
         if end_time.tzinfo is None:
             self.end_time = end_time.replace(tzinfo=timezone.utc)
         else:
             self.end_time = end_time.astimezone(timezone.utc)
-        self.message: Optional[discord.Message] = None
-        self.giveaway_cog = giveaway_cog
+        self.message: Optional[discord.PartialMessage] = None
         self.custom_id = custom_id
         self.is_ended = False
 
-    @discord.ui.button(label="Enter Giveaway", style=discord.ButtonStyle.success, emoji="🎉", custom_id="giveaway_enter")
-    async def enter(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.is_ended:
-            await interaction.response.send_message("This giveaway has ended!", ephemeral=True)
-            return
-            
-        if interaction.user.id in self.entries:
-            await interaction.response.send_message("You're already entered!", ephemeral=True)
-            return
-        
-        self.entries.add(interaction.user.id)
-        await interaction.response.send_message("You're entered!", ephemeral=True)
-        
-        # Save to database
-        await self.giveaway_cog.save_giveaway_to_db(self)
-        
-        # Update the embed with new entry count
-        await self.update_embed()
-            
+    def entry_weight(self, record: Optional[MemberRecord]) -> int:
+        # Entries for this member: the highest weight among their weighted roles, otherwise 1
+        if record is None:
+            return 1
+        return max((self.role_weights.get(role_id, 1) for role_id in record.role_ids), default=1)
+
+    def ineligibility_reason(self, record: Optional[MemberRecord]) -> Optional[str]:
+        # Why this member can't enter, or None if they meet every requirement
+        if not self.requirements:
+            return None
+        if record is None:
+            return "You must be a member of this server to enter."
+        required_role_id = self.requirements.get("required_role_id")
+        if required_role_id and required_role_id not in record.role_ids:
+            return f"You need the <@&{required_role_id}> role to enter this giveaway."
+        verified_role_id = self.requirements.get("verified_role_id")
+        if verified_role_id and verified_role_id not in record.role_ids:
+            return "You need to be verified to enter this giveaway. Use `/verify` first."
+        min_days = self.requirements.get("min_member_days") or 0
+        if min_days:
+            if record.joined_at is None or datetime.now(timezone.utc) - record.joined_at < timedelta(days=min_days):
+                return f"You need to have been in this server for at least {min_days} day(s) to enter."
+        return None
+
+    def build_view(self) -> discord.ui.View:
+        # View carrying this giveaway's enter button (only needed when sending/editing the message)
+        view = discord.ui.View(timeout=None)
+        view.add_item(GiveawayEnterButton(self.custom_id))
+        return view
+
     # Build the giveaway embed with current data.
     def _build_embed(self) -> discord.Embed:
         embed = discord.Embed(
@@ -64,6 +153,34 @@ class GiveawayView(discord.ui.View):
             inline=True,
         )
 
+        if self.winner_count > 1:
+            embed.add_field(
+                name="🏆 Winners",
+                value=str(self.winner_count),
+                inline=True,
+            )
+
+        requirements = []
+        if self.requirements.get("required_role_id"):
+            requirements.append(f"Role: <@&{self.requirements['required_role_id']}>")
+        if self.requirements.get("verified_role_id"):
+            requirements.append("Verified members only")
+        if self.requirements.get("min_member_days"):
+            requirements.append(f"In the server for {self.requirements['min_member_days']}+ day(s)")
+        if requirements:
+            embed.add_field(
+                name="📋 Requirements",
+                value="\n".join(requirements),
+                inline=False,
+            )
+
+        if self.role_weights:
+            embed.add_field(
+                name="⚖️ Bonus Entries",
+                value="\n".join(f"<@&{role_id}>: {weight}x" for role_id, weight in self.role_weights.items()),
+                inline=False,
+            )
+
         # Use Discord timestamps so the client renders a live countdown (no periodic edits needed)
         end_ts = int(self.end_time.timestamp())
         embed.add_field(
@@ -81,28 +198,18 @@ class GiveawayView(discord.ui.View):
         embed.set_footer(text=f"Giveaway ID: {self.custom_id}")
         return embed
       
-    # Update the giveaway message with current data.
-    async def update_embed(self):
+    # Update the giveaway message with current data (through the bot-wide edit scheduler).
+    async def update_embed(self, edits: EditScheduler, priority: EditPriority = EditPriority.INTERACTION):
         if not self.message:
             return
         
         embed = self._build_embed()
         try:
-            # Re-fetch message to get fresh reference that can be edited
-            try:
-                fresh_message = await self.message.channel.fetch_message(self.message.id)
-                self.message = fresh_message
-            except discord.NotFound:
-                logger.warning(f"Giveaway message {self.custom_id} was deleted")
-                self.message = None
-                return
-            except discord.Forbidden:
-                logger.error(f"No permission to fetch message for giveaway {self.custom_id}")
-                return
-            
-            # Edit the freshly fetched message
-            await self.message.edit(embed=embed)
-            
+            # Edit through the stored reference; no re-fetch needed before editing
+            await edits.edit(self.message, priority, embed=embed)
+        except discord.NotFound:
+            logger.warning(f"Giveaway message {self.custom_id} was deleted")
+            self.message = None
         except discord.Forbidden as e:
             logger.error(f"No permission to edit giveaway message {self.custom_id}: {e}")
         except discord.HTTPException as e:
@@ -111,21 +218,97 @@ class GiveawayView(discord.ui.View):
             logger.error(f"Unexpected error updating giveaway {self.custom_id}: {e}")
 
 
+class GiveawayHistoryView(discord.ui.View):
+    # Ephemeral pager over a guild's giveaway history using keyset cursors (no OFFSET scans)
+    def __init__(self, cog: "GiveawayCog", guild_id: int):
+        super().__init__(timeout=300)
+        self.cog = cog
+        self.guild_id = guild_id
+        # Cursor that produced each page seen so far (None = newest page)
+        self.cursors: List[Optional[tuple[str, str]]] = [None]
+        self.rows: List[dict] = []
+        self.has_more = False
+
+    async def load_page(self):
+        rows = await self.cog.db.load_giveaway_history(
+            self.guild_id, before=self.cursors[-1], limit=HISTORY_PAGE_SIZE + 1
+        )
+        self.has_more = len(rows) > HISTORY_PAGE_SIZE
+        self.rows = rows[:HISTORY_PAGE_SIZE]
+        self.newer_button.disabled = len(self.cursors) == 1
+        self.older_button.disabled = not self.has_more
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title="📜 Giveaway History",
+            color=discord.Color.gold(),
+        )
+        if not self.rows:
+            embed.description = "*No ended giveaways yet.*"
+        for row in self.rows:
+            ended_ts = int(row["end_time"].timestamp())
+            winners = ", ".join(f"<@{user_id}>" for user_id in row["winners"]) or "No winner"
+            embed.add_field(
+                name=row["prize"][:256],
+                value=(
+                    f"🏆 {winners}\n"
+                    f"👥 {row['entry_count']} entries • ⏰ <t:{ended_ts}:R>\n"
+                    f"ID: `{row['giveaway_id']}`"
+                )[:1024],
+                inline=False,
+            )
+        embed.set_footer(text=f"Page {len(self.cursors)}")
+        return embed
+
+    @discord.ui.button(label="Newer", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def newer_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self.load_page()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Older", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def older_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.has_more and self.rows:
+            last = self.rows[-1]
+            self.cursors.append((last["ended_at"], last["giveaway_id"]))
+        await self.load_page()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+
 class GiveawayCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
-        from pathlib import Path
         self.bot = bot
-        self.db = Database()
-        self.active_giveaways: dict[str, GiveawayView] = {}
-        self.giveaway_update_task.start()
+        self.db: Database = bot.db  # type: ignore[attr-defined]
+        self.edits: EditScheduler = bot.edits  # type: ignore[attr-defined]
+        self.active_giveaways: dict[str, Giveaway] = {}
+        # Message/channel locators of every stored giveaway (active or ended), for deletion events
+        self.message_index = MessageIndex()
+        # Route every enter button (any giveaway, any message) through GiveawayEnterButton
+        self.bot.add_dynamic_items(GiveawayEnterButton)
+        # Sleeps until the next giveaway end_time instead of polling
+        self.end_scheduler = DeadlineScheduler(self._on_giveaways_due, name="giveaway-end")
+        self.end_scheduler.start()
+        # At most one entry-count edit per giveaway message per window
+        self.embed_updates = UpdateCoalescer(EMBED_UPDATE_WINDOW, name="giveaway-embed")
+        # Background ending pipelines started by the scheduler. Slots and channel locks are shared by every
+        # pipeline, so overlapping batches still end at most ENDING_CONCURRENCY channels at a time and never
+        # run two endings in one channel at once; a channel's lock is dropped when its last worker is done.
+        self._ending_tasks: Set[asyncio.Task] = set()
+        self._ending_slots = asyncio.Semaphore(ENDING_CONCURRENCY)
+        self._ending_locks: Dict[int, asyncio.Lock] = {}
+        self._ending_workers: Dict[int, int] = {}
         self.database_cleanup_task.start()
         self.bot.loop.create_task(self._restore_giveaways())
         logger.info("GiveawayCog initialized")
 
-    def cog_unload(self):
+    async def cog_unload(self):
         logger.info("Unloading GiveawayCog...")
-        self.giveaway_update_task.cancel()
+        self.end_scheduler.stop()
+        self.embed_updates.cancel_all()
+        logger.info(f"Giveaway embed updates: {self.embed_updates.stats()}")
         self.database_cleanup_task.cancel()
+        self.bot.remove_dynamic_items(GiveawayEnterButton)
     
     async def cog_app_command_error(self, interaction: discord.Interaction, error: Exception):
         # Handle errors in app commands
@@ -142,105 +325,325 @@ class GiveawayCog(commands.Cog):
             logger.error("Failed to send error message to user")
     
     async def _restore_giveaways(self):
-        # Restore giveaways from database on startup
-        await self.bot.wait_until_ready()
-        await self.db.initialize()
-        
+        # Restore giveaways from the database without REST calls. Buttons are routed by custom_id,
+        # so nothing needs registering; message references come from the channel cache once ready.
         giveaways_data = await self.db.load_giveaways()
         logger.info(f"Restoring {len(giveaways_data)} giveaways from database")
+        for custom_id, channel_id, message_id in await self.db.load_giveaway_messages():
+            self.message_index.add(custom_id, channel_id, message_id)
         
+        await self.bot.wait_until_ready()
+        
+        restored: List[Giveaway] = []
         for data in giveaways_data:
             try:
-                # Fetch the message
-                channel = self.bot.get_channel(data["channel_id"])
-                if not channel:
-                    logger.warning(f"Channel {data['channel_id']} not found for giveaway {data['custom_id']}")
-                    continue
-                
-                try:
-                    message = await channel.fetch_message(data["message_id"])
-                except discord.NotFound:
-                    logger.warning(f"Message {data['message_id']} not found, deleting giveaway {data['custom_id']}")
-                    await self.db.delete_giveaway(data["custom_id"])
+                giveaway = self._giveaway_from_data(data)
+                if giveaway is None:
                     continue
-                
-                # Recreate the view
-                view = GiveawayView(
-                    prize=data["prize"],
-                    end_time=data["end_time"],
-                    giveaway_cog=self,
-                    custom_id=data["custom_id"]
-                )
-                view.entries = data["entries"]
-                view.message = message
-                view.is_ended = data["is_ended"]
-                
-                # Re-attach the view to the message
-                self.bot.add_view(view, message_id=message.id)
-                self.active_giveaways[data["custom_id"]] = view
-                
-                logger.info(f"Restored giveaway {data['custom_id']} with {len(view.entries)} entries")
+                restored.append(giveaway)
+                logger.info(f"Restored giveaway {data['custom_id']} with {len(giveaway.entries)} entries")
             except Exception as e:
                 logger.error(f"Failed to restore giveaway {data.get('custom_id', 'unknown')}: {e}")
+        
+        self.bot.loop.create_task(self._validate_restored_giveaways(restored))
+    
+    def _giveaway_from_data(self, data: dict) -> Optional[Giveaway]:
+        # Rebuild an active giveaway from a database row and arm its end timer
+        existing = self.active_giveaways.get(data["custom_id"])
+        if existing is not None:
+            return existing
+        
+        channel = self.bot.get_channel(data["channel_id"])
+        if not channel:
+            logger.warning(f"Channel {data['channel_id']} not found for giveaway {data['custom_id']}")
+            return None
+        
+        giveaway = Giveaway(
+            prize=data["prize"],
+            end_time=data["end_time"],
+            custom_id=data["custom_id"],
+            winner_count=data["winner_count"],
+            role_weights=data["role_weights"],
+            requirements=data["requirements"]
+        )
+        giveaway.entries = EntryPool.from_weights(data["entries"])
+        giveaway.winners = data["winners"]
+        giveaway.is_ended = data["is_ended"]
+        # PartialMessage: no fetch, resolved by the API only when we edit or reply
+        giveaway.message = channel.get_partial_message(data["message_id"])
+        
+        self.active_giveaways[giveaway.custom_id] = giveaway
+        self._schedule_end(giveaway)
+        return giveaway
+    
+    async def _get_giveaway(self, custom_id: str) -> Optional[Giveaway]:
+        # O(1) lookup of an active giveaway, falling back to the database if it isn't resident
+        giveaway = self.active_giveaways.get(custom_id)
+        if giveaway is not None:
+            return giveaway
+        data = await self.db.load_giveaway(custom_id)
+        if data is None:
+            return None
+        return self._giveaway_from_data(data)
+    
+    async def _validate_restored_giveaways(self, giveaways: List[Giveaway]):
+        # Background check (bounded concurrency) that restored giveaway messages still exist,
+        # upgrading legacy static enter buttons to per-giveaway dynamic ones on the way
+        semaphore = asyncio.Semaphore(RESTORE_VALIDATE_CONCURRENCY)
+        
+        async def validate(giveaway: Giveaway):
+            if not giveaway.message:
+                return
+            async with semaphore:
+                try:
+                    message = await self.edits.fetch(giveaway.message)
+                except discord.NotFound:
+                    # Deleted while the bot was offline (deletions while online arrive as events)
+                    await self._purge_giveaways({giveaway.custom_id}, f"message {giveaway.message.id} not found")
+                    return
+                except (discord.HTTPException, OSError) as e:
+                    logger.warning(f"Could not validate giveaway {giveaway.custom_id}: {e}")
+                    return
+                await self._migrate_legacy_giveaway_button(message, giveaway)
+        
+        await asyncio.gather(*(validate(giveaway) for giveaway in giveaways))
+        logger.info(f"Validated {len(giveaways)} restored giveaway(s)")
+    
+    async def _migrate_legacy_giveaway_button(self, message: discord.Message, giveaway: Giveaway):
+        # Swap the shared "giveaway_enter" custom_id for one that encodes the giveaway id
+        has_legacy_button = any(
+            getattr(component, "custom_id", None) == "giveaway_enter"
+            for row in message.components
+            for component in getattr(row, "children", [])
+        )
+        if not has_legacy_button:
+            return
+        try:
+            await self.edits.edit(message, view=giveaway.build_view())
+            logger.info(f"Migrated legacy giveaway button for {giveaway.custom_id}")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to update giveaway button for {giveaway.custom_id}: {e}")
     
-    async def save_giveaway_to_db(self, view: GiveawayView):
+    async def _purge_giveaways(self, custom_ids: Set[str], reason: str):
+        # Forget giveaways whose message or channel is gone: memory, timers, pending edits and database rows
+        for custom_id in custom_ids:
+            self.message_index.remove(custom_id)
+            self.active_giveaways.pop(custom_id, None)
+            self.end_scheduler.cancel(custom_id)
+            self.embed_updates.cancel(custom_id)
+            await self.db.delete_giveaway(custom_id)
+            logger.info(f"Removed giveaway {custom_id} ({reason})")
+    
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        custom_id = self.message_index.by_message(payload.message_id)
+        if custom_id:
+            await self._purge_giveaways({custom_id}, "message deleted")
+    
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        custom_ids = self.message_index.by_messages(payload.message_ids)
+        if custom_ids:
+            await self._purge_giveaways(custom_ids, "message bulk-deleted")
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        custom_ids = self.message_index.in_channel(channel.id)
+        if custom_ids:
+            await self._purge_giveaways(custom_ids, f"channel {channel.id} deleted")
+    
+    def _member_record(self, interaction: discord.Interaction) -> Optional[MemberRecord]:
+        # Look up the clicking member in the bot's member index
+        guild = interaction.guild
+        if guild is None:
+            return None
+        member_index = self.bot.member_index  # type: ignore[attr-defined]
+        record = member_index.get(guild, interaction.user.id)
+        if record is None and isinstance(interaction.user, discord.Member):
+            # Not in the gateway cache yet; the interaction payload carries the member's roles
+            member_index.upsert(interaction.user)
+            record = member_index.get(guild, interaction.user.id)
+        return record
+    
+    def _verified_role_id(self, guild: Optional[discord.Guild]) -> Optional[int]:
+        # Resolve the verification role the same way VerificationCog does (configured id, then name)
+        config = self.bot.config  # type: ignore[attr-defined]
+        if config.verify_role_id:
+            return config.verify_role_id
+        if guild and config.verify_role_name:
+            role = discord.utils.get(guild.roles, name=config.verify_role_name)
+            if role:
+                return role.id
+        return None
+    
+    async def handle_entry(self, interaction: discord.Interaction, custom_id: Optional[str]):
+        # Enter button callback, routed here by GiveawayEnterButton
+        if custom_id is None:
+            # Legacy button without an id: resolve through the message it's attached to
+            message_id = interaction.message.id if interaction.message else None
+            custom_id = self.message_index.by_message(message_id) if message_id else None
+        giveaway = await self._get_giveaway(custom_id) if custom_id else None
+        
+        if giveaway is None or giveaway.is_ended:
+            await interaction.response.send_message("This giveaway has ended!", ephemeral=True)
+            return
+            
+        if interaction.user.id in giveaway.entries:
+            await interaction.response.send_message("You're already entered!", ephemeral=True)
+            return
+        
+        # Requirements and weights come from the in-memory member index, never from REST
+        record = self._member_record(interaction)
+        reason = giveaway.ineligibility_reason(record)
+        if reason:
+            await interaction.response.send_message(f"❌ {reason}", ephemeral=True)
+            return
+        
+        weight = giveaway.entry_weight(record)
+        giveaway.entries.add(interaction.user.id, weight)
+        if weight > 1:
+            await interaction.response.send_message(f"You're entered with **{weight}** entries!", ephemeral=True)
+        else:
+            await interaction.response.send_message("You're entered!", ephemeral=True)
+        
+        # Save to database (single-row insert, independent of how many entries exist)
+        await self.save_giveaway_entry(giveaway, interaction.user.id, weight)
+        
+        # Update the embed with new entry count (coalesced: bursts of entries become one edit)
+        self.request_embed_update(giveaway)
+    
+    async def save_giveaway_to_db(self, giveaway: Giveaway):
         # Save a giveaway to the database
-        if not view.message:
+        if not giveaway.message:
             return
         
         await self.db.save_giveaway(
-            custom_id=view.custom_id,
-            prize=view.prize,
-            end_time=view.end_time,
-            channel_id=view.message.channel.id,
-            message_id=view.message.id,
-            entries=view.entries,
-            is_ended=view.is_ended
+            custom_id=giveaway.custom_id,
+            prize=giveaway.prize,
+            end_time=giveaway.end_time,
+            channel_id=giveaway.message.channel.id,
+            message_id=giveaway.message.id,
+            is_ended=giveaway.is_ended,
+            guild_id=giveaway.message.guild.id if giveaway.message.guild else None,
+            winner_count=giveaway.winner_count,
+            role_weights=giveaway.role_weights,
+            winners=giveaway.winners,
+            requirements=giveaway.requirements
         )
     
-    @tasks.loop(seconds=5)
-    async def giveaway_update_task(self):
-        # Background task to end giveaways once their end_time has passed.
+    async def archive_giveaway(self, giveaway: Giveaway):
+        # Record an ended giveaway's results in the history archive
+        if not giveaway.message:
+            return
+        
+        await self.db.archive_giveaway(
+            custom_id=giveaway.custom_id,
+            guild_id=giveaway.message.guild.id if giveaway.message.guild else None,
+            channel_id=giveaway.message.channel.id,
+            message_id=giveaway.message.id,
+            prize=giveaway.prize,
+            winners=giveaway.winners,
+            entry_count=len(giveaway.entries),
+            end_time=giveaway.end_time
+        )
+    
+    async def save_giveaway_entry(self, giveaway: Giveaway, user_id: int, weight: int = 1):
+        # Persist a single new entry for a giveaway
+        if not giveaway.message:
+            return
+        
+        await self.db.add_giveaway_entry(giveaway.custom_id, user_id, weight)
+    
+    def request_embed_update(self, giveaway: Giveaway):
+        # Queue a coalesced embed refresh for this giveaway's message
+        self.embed_updates.request(giveaway.custom_id, lambda: giveaway.update_embed(self.edits))
+    
+    def _schedule_end(self, giveaway: Giveaway):
+        # Arm the deadline scheduler for this giveaway's end_time
+        self.end_scheduler.schedule(giveaway.custom_id, giveaway.end_time)
+    
+    async def _on_giveaways_due(self, custom_ids: List[str]):
+        # Called by the deadline scheduler with every giveaway whose end_time has passed.
         # We intentionally do NOT edit giveaway messages on a timer; Discord clients can render
         # countdowns using <t:...:R> without any API traffic.
-        now = datetime.now(timezone.utc)
-        ended_giveaways = []
-
-        for custom_id, view in list(self.active_giveaways.items()):
-            try:
-                # Skip if no valid message reference
-                if not view.message:
-                    logger.warning(f"Skipping giveaway {custom_id}: no message reference")
-                    continue
-
-                if now >= view.end_time and not view.is_ended:
-                    # Giveaway has ended
-                    view.is_ended = True
-                    ended_giveaways.append((custom_id, view))
-            except OSError as e:
-                # Network errors (DNS, connection issues)
-                logger.warning(f"Network error checking giveaway {custom_id}: {e}. Will retry next cycle.")
-            except Exception as e:
-                logger.error(f"Error checking giveaway {custom_id}: {e}")
+        ended_giveaways: List[Giveaway] = []
         
-        # Process ended giveaways
-        for custom_id, view in ended_giveaways:
-            try:
-                await self._end_giveaway(view)
-                del self.active_giveaways[custom_id]
-                await self.db.delete_giveaway(custom_id)
-            except Exception as e:
-                logger.error(f"Error ending giveaway {custom_id}: {e}")
+        for custom_id in custom_ids:
+            giveaway = self.active_giveaways.get(custom_id)
+            if not giveaway or giveaway.is_ended:
+                continue
+            
+            # No valid message reference yet: try again shortly
+            if not giveaway.message:
+                logger.warning(f"Giveaway {custom_id} has no message reference, retrying in {END_RETRY_DELAY}s")
+                self.end_scheduler.schedule(
+                    custom_id, datetime.now(timezone.utc) + timedelta(seconds=END_RETRY_DELAY)
+                )
+                continue
+            
+            # Giveaway has ended
+            giveaway.is_ended = True
+            ended_giveaways.append(giveaway)
+        
+        if not ended_giveaways:
+            return
+        
+        # Run the endings in the background so the scheduler can keep firing other deadlines
+        task = asyncio.create_task(self._run_endings(ended_giveaways))
+        self._ending_tasks.add(task)
+        task.add_done_callback(self._ending_tasks.discard)
     
-    @giveaway_update_task.before_loop
-    async def before_giveaway_update(self):
-        await self.bot.wait_until_ready()
+    async def _run_endings(self, giveaways: List[Giveaway]):
+        # Ending pipeline: one worker per channel (edits/replies in a channel share Discord's per-route
+        # bucket, so they run in order), at most ENDING_CONCURRENCY channels at a time across all batches
+        by_channel: Dict[int, List[Giveaway]] = {}
+        for giveaway in giveaways:
+            by_channel.setdefault(giveaway.message.channel.id, []).append(giveaway)
+        
+        started = time.perf_counter()
+        
+        async def channel_worker(channel_id: int, channel_giveaways: List[Giveaway]):
+            lock = self._ending_locks.setdefault(channel_id, asyncio.Lock())
+            self._ending_workers[channel_id] = self._ending_workers.get(channel_id, 0) + 1
+            try:
+                # Channel first, then a slot: a worker queued behind its channel doesn't hold a slot
+                async with lock, self._ending_slots:
+                    for giveaway in channel_giveaways:
+                        await self._finish_giveaway(giveaway)
+            finally:
+                self._ending_workers[channel_id] -= 1
+                if not self._ending_workers[channel_id]:
+                    del self._ending_workers[channel_id]
+                    del self._ending_locks[channel_id]
+        
+        await asyncio.gather(
+            *(channel_worker(channel_id, channel_giveaways) for channel_id, channel_giveaways in by_channel.items()),
+            return_exceptions=True
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Ended {len(giveaways)} giveaway(s) across {len(by_channel)} channel(s) in {elapsed_ms:.0f}ms")
     
-    @giveaway_update_task.error
-    async def giveaway_update_task_error(self, error: Exception):
-        # Handle task-level errors to prevent task from stopping
-        logger.error(f"Giveaway update task encountered an error: {error}", exc_info=True)
-        # Task will automatically restart
+    async def _finish_giveaway(self, giveaway: Giveaway):
+        # End one giveaway; failures are contained so they never hold up the rest of the batch.
+        # The row is kept (is_ended = 1, with its winners and entries) so it can be rerolled;
+        # cleanup_old_entries removes it after the retention period. Writes from a batch of endings
+        # land in the same write-behind group commit.
+        started = time.perf_counter()
+        try:
+            await self._end_giveaway(giveaway)
+        except Exception as e:
+            logger.error(f"Error ending giveaway {giveaway.custom_id}: {e}")
+        finally:
+            self.active_giveaways.pop(giveaway.custom_id, None)
+            await self.save_giveaway_to_db(giveaway)
+            await self.archive_giveaway(giveaway)
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        lateness = (datetime.now(timezone.utc) - giveaway.end_time).total_seconds()
+        logger.info(
+            f"Giveaway {giveaway.custom_id} ended in {elapsed_ms:.0f}ms "
+            f"({lateness:.1f}s after its end time)"
+        )
     
     @tasks.loop(hours=24)
     async def database_cleanup_task(self):
@@ -249,6 +652,12 @@ class GiveawayCog(commands.Cog):
             deleted = await self.db.cleanup_old_entries(days=60)
             if deleted > 0:
                 logger.info(f"Database cleanup: removed {deleted} old entries")
+                # Drop locators of the giveaways that were cleaned up (keeping any started meanwhile)
+                index = MessageIndex.from_rows(await self.db.load_giveaway_messages())
+                for giveaway in self.active_giveaways.values():
+                    if giveaway.message:
+                        index.add(giveaway.custom_id, giveaway.message.channel.id, giveaway.message.id)
+                self.message_index = index
         except Exception as e:
             logger.error(f"Database cleanup task failed: {e}")
     
@@ -256,42 +665,97 @@ class GiveawayCog(commands.Cog):
     async def before_database_cleanup(self):
         await self.bot.wait_until_ready()
     
-    async def _end_giveaway(self, view: GiveawayView):
-        # End a giveaway and announce the winner
+    async def _announce(self, giveaway: Giveaway, content: str):
+        # Reply to the giveaway message; results are user-facing, so they go ahead of background edits
+        message = giveaway.message
+        await self.edits.submit(
+            message.channel.id,
+            lambda: message.reply(content),
+            priority=EditPriority.INTERACTION
+        )
+    
+    def _draw_winners(self, giveaway: Giveaway, count: int) -> List[int]:
+        # Weighted draw without replacement, skipping previous winners and members who left the server
+        guild = giveaway.message.guild if giveaway.message else None
+        accept = (lambda user_id: guild.get_member(user_id) is not None) if guild else None
+        return giveaway.entries.draw(count, accept=accept, exclude=set(giveaway.winners))
+    
+    async def _end_giveaway(self, giveaway: Giveaway):
+        # End a giveaway and announce the winners
         try:
-            # Final update to show "Ended" status
-            await view.update_embed()
+            # Final update to show "Ended" status (supersedes any pending coalesced update)
+            self.embed_updates.cancel(giveaway.custom_id)
+            await giveaway.update_embed(self.edits)
             
-            if not view.message:
+            if not giveaway.message:
                 logger.error("Cannot end giveaway: no message reference")
                 return
             
-            # Determine winner
-            if not view.entries:
-                await view.message.reply("🎉 Giveaway ended! No entries, so no winner.")
+            # Determine winners
+            if not giveaway.entries:
+                await self._announce(giveaway, "🎉 Giveaway ended! No entries, so no winner.")
                 return
             
-            winner_id = random.choice(list(view.entries))
-            guild = view.message.guild
-            winner = guild.get_member(winner_id) if guild else None
+            winners = self._draw_winners(giveaway, giveaway.winner_count)
+            giveaway.winners.extend(winners)
             
-            if winner:
-                await view.message.reply(
-                    f"🎉 **Giveaway ended!**\n\nCongratulations {winner.mention}! You won: **{view.prize}**"
+            if winners:
+                mentions = ", ".join(f"<@{user_id}>" for user_id in winners)
+                await self._announce(
+                    giveaway,
+                    f"🎉 **Giveaway ended!**\n\nCongratulations {mentions}! You won: **{giveaway.prize}**"
                 )
             else:
-                await view.message.reply("🎉 Giveaway ended! Winner left the server or cannot be found.")
+                await self._announce(giveaway, "🎉 Giveaway ended! No entrant is still in the server, so no winner.")
         except Exception as e:
             logger.error(f"Error ending giveaway: {e}")
     
     @app_commands.default_permissions(manage_guild=True)
     @app_commands.command(name="giveaway_start", description="Start a giveaway (admin only)")
-    @app_commands.describe(duration_minutes="Duration in minutes", prize="Description of the prize")
-    async def giveaway_start(self, interaction: discord.Interaction, duration_minutes: int, prize: str):
+    @app_commands.describe(
+        duration_minutes="Duration in minutes",
+        prize="Description of the prize",
+        winners="Number of winners to draw (default 1)",
+        role_weights="Bonus entries per role, e.g. @Officer=3, @Member=2",
+        required_role="Only members with this role can enter",
+        verified_only="Only verified members can enter",
+        min_days_in_server="Minimum days a member must have been in the server",
+    )
+    async def giveaway_start(
+        self,
+        interaction: discord.Interaction,
+        duration_minutes: int,
+        prize: str,
+        winners: app_commands.Range[int, 1, MAX_WINNERS] = 1,
+        role_weights: Optional[str] = None,
+        required_role: Optional[discord.Role] = None,
+        verified_only: bool = False,
+        min_days_in_server: app_commands.Range[int, 0, 3650] = 0,
+    ):
         try:
             if duration_minutes <= 0:
                 await interaction.response.send_message("❌ Duration must be positive.", ephemeral=True)
                 return
+            
+            try:
+                weights = parse_role_weights(role_weights)
+            except ValueError as e:
+                await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+                return
+            
+            requirements: Dict[str, Any] = {}
+            if required_role:
+                requirements["required_role_id"] = required_role.id
+            if verified_only:
+                verified_role_id = self._verified_role_id(interaction.guild)
+                if not verified_role_id:
+                    await interaction.response.send_message(
+                        "❌ No verification role is configured for this server.", ephemeral=True
+                    )
+                    return
+                requirements["verified_role_id"] = verified_role_id
+            if min_days_in_server:
+                requirements["min_member_days"] = min_days_in_server
 
             # Calculate end time (store as UTC-aware for correct timestamp rendering)
             end_time = datetime.now(timezone.utc) + timedelta(minutes=duration_minutes)
@@ -301,25 +765,104 @@ class GiveawayCog(commands.Cog):
             
             logger.info(f"Creating giveaway: {prize} (duration: {duration_minutes}m, ID: {custom_id})")
             
-            view = GiveawayView(prize, end_time, self, custom_id)
-            embed = view._build_embed()
+            giveaway = Giveaway(
+                prize,
+                end_time,
+                custom_id,
+                winner_count=winners,
+                role_weights=weights,
+                requirements=requirements
+            )
+            embed = giveaway._build_embed()
             
             await interaction.response.send_message(
                 embed=embed,
-                view=view,
+                view=giveaway.build_view(),
             )
             
-            # Store message reference and register view
-            view.message = await interaction.original_response()
-            self.active_giveaways[custom_id] = view
+            # Store message reference and register the giveaway. A channel PartialMessage is used instead of the
+            # InteractionMessage so later edits don't depend on the 15-minute interaction webhook token.
+            response = await interaction.original_response()
+            giveaway.message = response.channel.get_partial_message(response.id)
+            self.active_giveaways[custom_id] = giveaway
+            self.message_index.add(custom_id, response.channel.id, response.id)
+            self._schedule_end(giveaway)
             
             # Save to database
-            await self.save_giveaway_to_db(view)
+            await self.save_giveaway_to_db(giveaway)
             
             logger.info(f"✅ Giveaway '{prize}' started successfully (ID: {custom_id})")
         except Exception as e:
             logger.error(f"Failed to start giveaway: {e}", exc_info=True)
             raise
+    
+    @app_commands.default_permissions(manage_guild=True)
+    @app_commands.command(name="giveaway_reroll", description="Draw new winner(s) for an ended giveaway (admin only)")
+    @app_commands.describe(
+        giveaway_id="The giveaway ID shown in the giveaway footer",
+        winners="Number of new winners to draw (default 1)",
+    )
+    async def giveaway_reroll(
+        self,
+        interaction: discord.Interaction,
+        giveaway_id: str,
+        winners: app_commands.Range[int, 1, MAX_WINNERS] = 1,
+    ):
+        data = await self.db.load_giveaway(giveaway_id.strip(), include_ended=True)
+        channel = self.bot.get_channel(data["channel_id"]) if data else None
+        # Giveaway ids are public (embed footers): only the server that ran a giveaway may reroll it.
+        # Rows saved before guild_id was stored fall back to the channel's guild.
+        guild = getattr(channel, "guild", None)
+        guild_id = data and (data["guild_id"] or (guild.id if guild else None))
+        if data is None or guild_id is None or guild_id != interaction.guild_id:
+            await interaction.response.send_message("❌ Giveaway not found.", ephemeral=True)
+            return
+        if not data["is_ended"]:
+            await interaction.response.send_message("❌ That giveaway hasn't ended yet.", ephemeral=True)
+            return
+        
+        if not channel:
+            await interaction.response.send_message("❌ The giveaway's channel no longer exists.", ephemeral=True)
+            return
+        
+        giveaway = Giveaway(
+            prize=data["prize"],
+            end_time=data["end_time"],
+            custom_id=data["custom_id"],
+            winner_count=data["winner_count"],
+            role_weights=data["role_weights"],
+            requirements=data["requirements"]
+        )
+        giveaway.entries = EntryPool.from_weights(data["entries"])
+        giveaway.winners = data["winners"]
+        giveaway.is_ended = True
+        giveaway.message = channel.get_partial_message(data["message_id"])
+        
+        new_winners = self._draw_winners(giveaway, winners)
+        if not new_winners:
+            await interaction.response.send_message(
+                "❌ No eligible entrants left to draw (everyone has won or left the server).",
+                ephemeral=True
+            )
+            return
+        
+        giveaway.winners.extend(new_winners)
+        await self.save_giveaway_to_db(giveaway)
+        await self.archive_giveaway(giveaway)
+        
+        mentions = ", ".join(f"<@{user_id}>" for user_id in new_winners)
+        await interaction.response.send_message(f"🔁 Rerolled **{giveaway.prize}**: congratulations {mentions}!")
+        logger.info(f"Rerolled giveaway {giveaway.custom_id}: {len(new_winners)} new winner(s)")
+    
+    @app_commands.command(name="giveaway_history", description="Browse past giveaways and their winners")
+    async def giveaway_history(self, interaction: discord.Interaction):
+        if not interaction.guild_id:
+            await interaction.response.send_message("❌ This command must be used in a server.", ephemeral=True)
+            return
+        
+        view = GiveawayHistoryView(self, interaction.guild_id)
+        await view.load_page()
+        await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(GiveawayCog(bot))
\ No newline at end of file
@@ -1,23 +1,126 @@
 from __future__ import annotations
 import asyncio
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime
+import time
+from typing import Dict, Optional, List, Set, Tuple
+from datetime import datetime, timedelta
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from ..utils.coalescer import UpdateCoalescer
 from ..utils.database import Database
+from ..utils.edit_scheduler import EditPriority, EditScheduler
+from ..utils.message_index import MessageIndex
 
 logger = logging.getLogger("bot.roster")
 
+# Max concurrent message fetches when validating restored rosters after startup
+RESTORE_VALIDATE_CONCURRENCY = 5
+
+# Minimum seconds between roster embed edits; changes inside the window collapse into one trailing edit
+ROSTER_UPDATE_WINDOW = 3.0
+
+# Rosters without a click for this many days are evicted from memory (rehydrated from the database on the next click)
+ROSTER_IDLE_DAYS = 14
+
+# Discord embed limits (field value, fields per embed, total characters); the total keeps some headroom
+FIELD_VALUE_LIMIT = 1024
+EMBED_FIELD_LIMIT = 25
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_CHAR_BUDGET = 5800
+
 
 class SkillLevel:
     ROOKIE = "🐣 Rookie"
     INTERMEDIATE = "🌵 Intermediate"
     VETERAN = "🥷 Veteran"
 
+# Order skill groups are listed in
+SKILL_ORDER = (SkillLevel.VETERAN, SkillLevel.INTERMEDIATE, SkillLevel.ROOKIE)
+
+
+def _chunk_lines(lines: List[str], limit: int = FIELD_VALUE_LIMIT) -> List[Tuple[str, int]]:
+    # Pack lines into field values of at most limit characters; returns (value, line count) per chunk
+    chunks: List[Tuple[str, int]] = []
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        line = line[:limit]
+        added = len(line) + (1 if current else 0)
+        if current and size + added > limit:
+            chunks.append(("\n".join(current), len(current)))
+            current, size = [], 0
+            added = len(line)
+        current.append(line)
+        size += added
+    if current:
+        chunks.append(("\n".join(current), len(current)))
+    return chunks
+
+
+# Label, style and emoji of each roster button action
+ROSTER_BUTTONS = {
+    "interested": ("I'm Interested!", discord.ButtonStyle.primary, "✋"),
+    "remove": ("Remove Me", discord.ButtonStyle.danger, "❎"),
+    "list": ("Full List", discord.ButtonStyle.secondary, "📋"),
+}
+
+
+class RosterButton(discord.ui.DynamicItem[discord.ui.Button], template=r"(?:(?P<roster_id>roster_[0-9]+)|roster)_(?P<action>interested|remove|list)"):
+    # Roster button whose custom_id carries the roster id and action, so clicks are routed without a resident
+    # view and rosters evicted from memory are loaded on demand. The legacy shared ids ("roster_interested",
+    # "roster_remove") also match and are resolved by message id.
+    def __init__(self, roster_id: Optional[str], action: str):
+        label, style, emoji = ROSTER_BUTTONS[action]
+        super().__init__(
+            discord.ui.Button(
+                label=label,
+                style=style,
+                emoji=emoji,
+                custom_id=f"{roster_id or 'roster'}_{action}",
+            )
+        )
+        self.roster_id = roster_id
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["roster_id"], match["action"])
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("RosterCog")
+        if cog is None:
+            await interaction.response.send_message("Rosters are unavailable right now.", ephemeral=True)
+            return
+        await cog.handle_click(interaction, self.roster_id, self.action)
+
+
+class RosterListView(discord.ui.View):
+    # Ephemeral pager showing every participant when the roster is too large for one embed
+    def __init__(self, pages: List[discord.Embed]):
+        super().__init__(timeout=300)
+        self.pages = pages
+        self.page = 0
+        self._sync_buttons()
+
+    def _sync_buttons(self):
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= len(self.pages) - 1
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(len(self.pages) - 1, self.page + 1)
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+
 # Modal to collect roster configuration from admin
 class RosterConfigModal(discord.ui.Modal, title="Configure CTF Roster"):
     
@@ -70,22 +173,22 @@ class RosterConfigModal(discord.ui.Modal, title="Configure CTF Roster"):
                 await interaction.response.send_message("Invalid roster limit! Must be a number.", ephemeral=True)
                 return
         
-        # Store config in the view
-        self.view.title = self.roster_title.value
-        self.view.date_time = self.roster_datetime.value
-        self.view.description = self.roster_description.value
-        self.view.limit = limit
-        self.view.thumbnail = self.thumbnail_url.value.strip() or None
+        # Store config on the roster
+        self.roster.title = self.roster_title.value
+        self.roster.date_time = self.roster_datetime.value
+        self.roster.description = self.roster_description.value
+        self.roster.limit = limit
+        self.roster.thumbnail = self.thumbnail_url.value.strip() or None
         
         # Create the roster embed and post it
-        await self.view.post_roster(interaction)
+        await self.roster.post_roster(interaction)
 
 
 class SkillSelectView(discord.ui.View):
     
-    def __init__(self, roster_view: RosterMainView, user: discord.Member):
+    def __init__(self, roster: Roster, user: discord.Member):
         super().__init__(timeout=180)  # 3 minute timeout
-        self.roster_view = roster_view
+        self.roster = roster
         self.user = user
         self.selected_skill: Optional[str] = None
     
@@ -124,7 +227,7 @@ class SkillSelectView(discord.ui.View):
 
     # register user with skill level
     async def finalize_registration(self, interaction: discord.Interaction, skill_level: str):
-        success = await self.roster_view.add_participant(self.user, skill_level)
+        success = await self.roster.add_participant(self.user, skill_level)
         
         if success:
             await interaction.response.edit_message(
@@ -133,7 +236,7 @@ class SkillSelectView(discord.ui.View):
                 embed=None,
             )
             # Update the roster display
-            await self.roster_view.update_roster_display()
+            self.roster.request_display_update()
         else:
             await interaction.response.edit_message(
                 content="❌ Registration failed. The roster may be full.",
@@ -144,17 +247,12 @@ class SkillSelectView(discord.ui.View):
         self.stop()
 
 
-class RosterMainView(discord.ui.View):
-    
+class Roster:
+    # In-memory state of a resident roster (no discord.ui.View; its buttons route by custom_id via RosterButton)
     def __init__(self, cog: RosterCog, custom_id: str):
-        super().__init__(timeout=None)  # Persistent view
         self.cog = cog
         self.custom_id = custom_id
         
-        # Set unique custom_ids for buttons based on roster custom_id
-        self.interested_button.custom_id = f"{custom_id}_interested"
-        self.remove_button.custom_id = f"{custom_id}_remove"
-        
         # Roster configuration
         self.title: str = ""
         self.date_time: str = ""
@@ -164,18 +262,28 @@ class RosterMainView(discord.ui.View):
         
         # Participants: user_id -> (username, skill_level)
         self.participants: Dict[int, tuple[str, str]] = {}
+        # Same participants grouped by skill level, and each group's rendered field chunks.
+        # A change only invalidates its own group's chunks, so re-rendering doesn't rescan the roster.
+        self._groups: Dict[str, Dict[int, str]] = {level: {} for level in SKILL_ORDER}
+        self._fragments: Dict[str, List[Tuple[str, int]]] = {}
         
         # Message reference for updating
-        self.roster_message: Optional[discord.Message] = None
+        self.roster_message: Optional[discord.Message | discord.PartialMessage] = None
         self.channel_id: Optional[int] = None
         self.message_id: Optional[int] = None
+        self.guild_id: Optional[int] = None
         
-        # Rate limit tracking
-        self._last_update: float = 0
-        self._update_cooldown: float = 3.0  # 3 seconds between updates
+        # Monotonic time of the last click; idle rosters are evicted from memory
+        self.last_active: float = time.monotonic()
+    
+    def build_view(self) -> discord.ui.View:
+        # View carrying this roster's buttons (only needed when sending/editing the message)
+        view = discord.ui.View(timeout=None)
+        for action in ROSTER_BUTTONS:
+            view.add_item(RosterButton(self.custom_id, action))
+        return view
     
-    @discord.ui.button(label="I'm Interested!", style=discord.ButtonStyle.primary, emoji="✋")
-    async def interested_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def on_interested(self, interaction: discord.Interaction):
         
         # Check if roster is full
         if self.limit and len(self.participants) >= self.limit:
@@ -214,8 +322,7 @@ class RosterMainView(discord.ui.View):
         )
     
     # Handle when a user wants to remove themselves from the roster.
-    @discord.ui.button(label="Remove Me", style=discord.ButtonStyle.danger, emoji="❎")
-    async def remove_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def on_remove(self, interaction: discord.Interaction):
         
         if interaction.user.id not in self.participants:
             await interaction.response.send_message(
@@ -225,17 +332,90 @@ class RosterMainView(discord.ui.View):
             return
         
         # Remove the user
-        del self.participants[interaction.user.id]
+        self._remove(interaction.user.id)
         await interaction.response.send_message(
             "✅ You've been removed from the roster.",
             ephemeral=True,
         )
         
         # Save to database
-        await self.cog.save_roster_to_db(self)
+        await self.cog.delete_roster_participant(self, interaction.user.id)
         
         # Update the roster display
-        await self.update_roster_display(force=True)
+        self.request_display_update()
+
+    # Show every participant, paginated, when the roster doesn't fit in its message
+    async def on_list(self, interaction: discord.Interaction):
+        pages = self.build_pages()
+        await interaction.response.send_message(
+            embed=pages[0],
+            view=RosterListView(pages) if len(pages) > 1 else discord.utils.MISSING,
+            ephemeral=True,
+        )
+
+    def set_participants(self, participants: Dict[int, tuple[str, str]]):
+        # Replace all participants (e.g. when restoring from the database)
+        for user_id in self.participants:
+            self.cog.rosters.participant_removed(self, user_id)
+        self.participants = {}
+        self._groups = {level: {} for level in SKILL_ORDER}
+        self._fragments.clear()
+        for user_id, (username, skill_level) in participants.items():
+            self._add(user_id, username, skill_level)
+
+    def _add(self, user_id: int, username: str, skill_level: str):
+        # Re-adding a participant (e.g. a second skill pick) moves them out of their previous group
+        previous = self.participants.get(user_id)
+        if previous and previous[1] in self._groups:
+            self._groups[previous[1]].pop(user_id, None)
+            self._fragments.pop(previous[1], None)
+        self.participants[user_id] = (username, skill_level)
+        if skill_level in self._groups:
+            self._groups[skill_level][user_id] = username
+            self._fragments.pop(skill_level, None)
+        self.cog.rosters.participant_added(self, user_id)
+
+    def _remove(self, user_id: int):
+        entry = self.participants.pop(user_id, None)
+        if entry and entry[1] in self._groups:
+            self._groups[entry[1]].pop(user_id, None)
+            self._fragments.pop(entry[1], None)
+        self.cog.rosters.participant_removed(self, user_id)
+
+    def _group_fields(self) -> List[Tuple[str, str, int]]:
+        # (name, value, participant count) fields for every skill group, rebuilding only invalidated groups
+        fields: List[Tuple[str, str, int]] = []
+        for level in SKILL_ORDER:
+            members = self._groups[level]
+            if not members:
+                continue
+            chunks = self._fragments.get(level)
+            if chunks is None:
+                chunks = _chunk_lines([f"• {name}" for name in members.values()])
+                self._fragments[level] = chunks
+            for index, (value, count) in enumerate(chunks):
+                name = f"{level} ({len(members)})" if index == 0 else f"{level} (cont.)"
+                fields.append((name, value, count))
+        return fields
+
+    def build_pages(self) -> List[discord.Embed]:
+        # The full participant list split into as many embeds as needed
+        pages: List[discord.Embed] = []
+        page: Optional[discord.Embed] = None
+        for name, value, _ in self._group_fields():
+            if page is None or len(page.fields) >= EMBED_FIELD_LIMIT or len(page) + len(name) + len(value) > EMBED_CHAR_BUDGET:
+                page = discord.Embed(title=f"{self.title[:200]} — Full Roster", color=discord.Color.purple())
+                pages.append(page)
+            page.add_field(name=name, value=value, inline=True)
+        if not pages:
+            pages.append(discord.Embed(
+                title=f"{self.title[:200]} — Full Roster",
+                description="*No participants yet.*",
+                color=discord.Color.purple(),
+            ))
+        for number, page in enumerate(pages, start=1):
+            page.set_footer(text=f"{len(self.participants)} participant(s) • Page {number}/{len(pages)}")
+        return pages
 
     # adds member, returns true
     async def add_participant(self, user: discord.Member, skill_level: str) -> bool:
@@ -244,10 +424,10 @@ class RosterMainView(discord.ui.View):
         if self.limit and len(self.participants) >= self.limit:
             return False
         
-        self.participants[user.id] = (user.display_name, skill_level)
+        self._add(user.id, user.display_name, skill_level)
         
         # Save to database
-        await self.cog.save_roster_to_db(self)
+        await self.cog.save_roster_participant(self, user.id)
         
         return True
 
@@ -259,24 +439,19 @@ class RosterMainView(discord.ui.View):
             await interaction.response.send_message(
                 content="📋 **CTF Roster Created!**",
                 embed=embed,
-                view=self,
+                view=self.build_view(),
             )
             
-            # Store message reference
-            self.roster_message = await interaction.original_response()
+            # Store message reference. A channel PartialMessage is used instead of the InteractionMessage
+            # so later edits don't depend on the 15-minute interaction webhook token (and need no fetch).
+            response = await interaction.original_response()
+            self.roster_message = response.channel.get_partial_message(response.id)
             self.channel_id = interaction.channel_id
-            self.message_id = self.roster_message.id
-
-            # Convert InteractionMessage to a regular Message immediately to avoid webhook-token expiry
-            try:
-                channel = interaction.channel or self.cog.bot.get_channel(self.channel_id)
-                if channel:
-                    self.roster_message = await channel.fetch_message(self.message_id)
-            except Exception as conv_e:
-                logger.warning(f"Could not convert roster message to regular Message: {conv_e}")
+            self.message_id = response.id
+            self.guild_id = interaction.guild_id
             
-            # Register this view with the cog
-            self.cog.active_rosters[self.custom_id] = self
+            # Register this roster with the cog
+            self.cog.rosters.add(self)
             
             # Save to database
             await self.cog.save_roster_to_db(self)
@@ -286,87 +461,52 @@ class RosterMainView(discord.ui.View):
             logger.error(f"Failed to post roster: {e}", exc_info=True)
             raise
 
-    # Updates the roster embed with current participants
-    async def update_roster_display(self, force: bool = False, retry: bool = True):
-        import time
-        import asyncio
-        
-        # Rate limit check
-        now = time.time()
-        if not force and (now - self._last_update) < self._update_cooldown:
-            logger.debug(f"Skipping roster update for {self.custom_id} - rate limited")
+    def request_display_update(self):
+        # Schedule a debounced re-render; bursts collapse into one trailing edit showing the final state
+        self.cog.display_updates.request(self.custom_id, self.update_roster_display)
+
+    async def _recover_message(self) -> bool:
+        # Re-fetch the roster message through the channel (e.g. after the interaction webhook expired)
+        self.roster_message = None
+        if not (self.channel_id and self.message_id):
+            logger.warning(f"Cannot update roster {self.custom_id}: no message reference")
+            return False
+        channel = self.cog.bot.get_channel(self.channel_id)
+        if not channel:
+            return False
+        try:
+            self.roster_message = await self.cog.edits.fetch(channel.get_partial_message(self.message_id))
+            logger.info(f"Recovered roster message reference for {self.custom_id}")
+            return True
+        except discord.NotFound:
+            logger.warning(f"Roster message {self.custom_id} was deleted")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to recover roster message: {e}")
+        return False
+
+    # Updates the roster embed with current participants.
+    # Called through request_display_update. The edit scheduler absorbs 429s; one that still surfaces
+    # propagates so the coalescer backs off for Retry-After.
+    async def update_roster_display(self):
+        if not self.roster_message and not await self._recover_message():
             return
         
-        if not self.roster_message:
-            # Try to recover message reference if we have IDs
-            if self.channel_id and self.message_id:
-                try:
-                    channel = self.cog.bot.get_channel(self.channel_id)
-                    if channel:
-                        self.roster_message = await channel.fetch_message(self.message_id)
-                        logger.info(f"Recovered roster message reference for {self.custom_id}")
-                except Exception as e:
-                    logger.error(f"Failed to recover roster message: {e}")
-                    return
-            else:
-                logger.warning(f"Cannot update roster {self.custom_id}: no message reference")
-                return
-        
         embed = self._build_embed()
         
         try:
-            # Edit the message directly
-            await self.roster_message.edit(embed=embed)
-            self._last_update = now
-        except discord.NotFound:
-            # Could be deleted OR an expired interaction webhook; try to recover and retry once
-            if self.channel_id and self.message_id:
-                try:
-                    channel = self.cog.bot.get_channel(self.channel_id)
-                    if channel:
-                        self.roster_message = await channel.fetch_message(self.message_id)
-                        logger.info(f"Recovered message reference for roster {self.custom_id} after NotFound, retrying update")
-                        await self.roster_message.edit(embed=embed)
-                        self._last_update = now
-                        return
-                except discord.NotFound:
-                    logger.warning(f"Roster message {self.custom_id} was deleted")
-                except Exception as rec_e:
-                    logger.error(f"Failed to recover roster message after NotFound: {rec_e}")
-            self.roster_message = None
+            await self.cog.edits.edit(self.roster_message, EditPriority.INTERACTION, embed=embed, view=self.build_view())
         except discord.Forbidden as e:
             logger.error(f"No permission to edit roster message {self.custom_id}: {e}")
         except discord.HTTPException as e:
-            # Handle rate limits with exponential backoff
             if e.status == 429:
-                retry_after = float(e.response.headers.get('Retry-After', 5))
-                logger.warning(f"Rate limited on roster {self.custom_id}. Retry after {retry_after}s")
-                if retry:
-                    await asyncio.sleep(retry_after)
-                    await self.update_roster_display(force=True, retry=False)
+                raise
+            if isinstance(e, discord.NotFound) or e.status == 401 or "Webhook" in str(e):
+                # Deleted message or an expired interaction webhook; recover and retry once
+                logger.warning(f"Invalid message reference for roster {self.custom_id}, attempting recovery and retry")
+                if await self._recover_message():
+                    await self.cog.edits.edit(self.roster_message, EditPriority.INTERACTION, embed=embed, view=self.build_view())
                 return
-            elif e.status == 401 or "Webhook" in str(e):
-                # If the original interaction webhook token expired, recover and retry once
-                logger.error(f"Invalid message reference for roster {self.custom_id}, attempting recovery and retry")
-                self.roster_message = None
-                if self.channel_id and self.message_id:
-                    try:
-                        channel = self.cog.bot.get_channel(self.channel_id)
-                        if channel:
-                            self.roster_message = await channel.fetch_message(self.message_id)
-                            logger.info(f"Recovered message reference for roster {self.custom_id}, retrying update")
-                            await self.roster_message.edit(embed=embed)
-                            self._last_update = now
-                            return
-                    except Exception as rec_e:
-                        logger.error(f"Failed to recover roster message: {rec_e}")
-                        return
-                # If we couldn't recover, just return and let future interactions try again
-                return
-            else:
-                logger.error(f"Failed to update roster embed: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating roster {self.custom_id}: {e}")
+            logger.error(f"Failed to update roster embed: {e}")
 
     # builds roster with admin entered data
     def _build_embed(self) -> discord.Embed:
@@ -394,39 +534,26 @@ class RosterMainView(discord.ui.View):
             inline=False,
         )
         
-        # Group participants by skill level
-        rookies = []
-        intermediates = []
-        veterans = []
-        
-        for user_id, (username, skill_level) in self.participants.items():
-            if skill_level == SkillLevel.ROOKIE:
-                rookies.append(username)
-            elif skill_level == SkillLevel.INTERMEDIATE:
-                intermediates.append(username)
-            elif skill_level == SkillLevel.VETERAN:
-                veterans.append(username)
-        
-        # Add participant lists by skill level
-        if veterans:
-            embed.add_field(
-                name=f"{SkillLevel.VETERAN} ({len(veterans)})",
-                value="\n".join(f"• {name}" for name in veterans),
-                inline=True,
-            )
-        
-        if intermediates:
-            embed.add_field(
-                name=f"{SkillLevel.INTERMEDIATE} ({len(intermediates)})",
-                value="\n".join(f"• {name}" for name in intermediates),
-                inline=True,
+        # Add participant lists by skill level, as many chunks as fit within Discord's embed limits
+        # (one field slot and some characters are kept for the overflow note)
+        footer = "Click 'I'm Interested!' to join"
+        hidden = 0
+        for name, value, count in self._group_fields():
+            fits = (
+                not hidden
+                and len(embed.fields) < EMBED_FIELD_LIMIT - 1
+                and len(embed) + len(footer) + len(name) + len(value) <= EMBED_CHAR_BUDGET - 200
             )
+            if fits:
+                embed.add_field(name=name, value=value, inline=True)
+            else:
+                hidden += count
         
-        if rookies:
+        if hidden:
             embed.add_field(
-                name=f"{SkillLevel.ROOKIE} ({len(rookies)})",
-                value="\n".join(f"• {name}" for name in rookies),
-                inline=True,
+                name="➕ More",
+                value=f"…and {hidden} more participant(s). Press **Full List** to see everyone.",
+                inline=False,
             )
         
         if not self.participants:
@@ -440,25 +567,112 @@ class RosterMainView(discord.ui.View):
         if self.thumbnail:
             embed.set_thumbnail(url=self.thumbnail)
         
-        embed.set_footer(text="Click 'I'm Interested!' to join")
+        embed.set_footer(text=footer)
         
         return embed
 
+class RosterRegistry:
+    # Resident rosters plus secondary indexes, all updated incrementally on add/evict/remove and join/leave.
+    # Message and channel locators cover every stored roster (resident or not); the participant index covers
+    # resident rosters, and the database answers for the rest (see /my_rosters).
+    def __init__(self):
+        self._rosters: Dict[str, Roster] = {}
+        self.locations = MessageIndex()
+        self._by_user: Dict[int, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rosters)
+
+    def __contains__(self, custom_id: str) -> bool:
+        return custom_id in self._rosters
+
+    @property
+    def all_resident(self) -> bool:
+        # True when every stored roster is in memory (no database fallback needed)
+        return len(self._rosters) >= len(self.locations)
+
+    def get(self, custom_id: Optional[str]) -> Optional[Roster]:
+        return self._rosters.get(custom_id) if custom_id else None
+
+    def values(self) -> List[Roster]:
+        return list(self._rosters.values())
+
+    def add(self, roster: Roster):
+        # Make a roster resident and index it
+        self.evict(roster.custom_id)
+        self._rosters[roster.custom_id] = roster
+        if roster.channel_id and roster.message_id:
+            self.locations.add(roster.custom_id, roster.channel_id, roster.message_id)
+        for user_id in roster.participants:
+            self._by_user.setdefault(user_id, set()).add(roster.custom_id)
+
+    def evict(self, custom_id: str) -> Optional[Roster]:
+        # Drop a roster from memory (it stays stored, so its locator is kept)
+        roster = self._rosters.pop(custom_id, None)
+        if roster is None:
+            return None
+        for user_id in roster.participants:
+            self._discard(self._by_user, user_id, custom_id)
+        return roster
+
+    def remove(self, custom_id: str) -> Optional[Roster]:
+        # Forget a deleted roster entirely
+        self.locations.remove(custom_id)
+        return self.evict(custom_id)
+
+    def participant_added(self, roster: Roster, user_id: int):
+        if self._rosters.get(roster.custom_id) is roster:
+            self._by_user.setdefault(user_id, set()).add(roster.custom_id)
+
+    def participant_removed(self, roster: Roster, user_id: int):
+        if self._rosters.get(roster.custom_id) is roster:
+            self._discard(self._by_user, user_id, roster.custom_id)
+
+    def by_message(self, message_id: int) -> Optional[str]:
+        return self.locations.by_message(message_id)
+
+    def by_messages(self, message_ids) -> Set[str]:
+        return self.locations.by_messages(message_ids)
+
+    def in_channel(self, channel_id: int) -> Set[str]:
+        return self.locations.in_channel(channel_id)
+
+    def for_user(self, user_id: int) -> List[Roster]:
+        return [self._rosters[custom_id] for custom_id in self._by_user.get(user_id, ())]
+
+    @staticmethod
+    def _discard(index: Dict[int, Set[str]], key: int, custom_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(custom_id)
+            if not ids:
+                del index[key]
+
+
 # CTF roster cog
 class RosterCog(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
-        from pathlib import Path
         self.bot = bot
-        self.db = Database()
-        self.active_rosters: Dict[str, RosterMainView] = {}
-        self.roster_refresh_task.start()
+        self.db: Database = bot.db  # type: ignore[attr-defined]
+        self.edits: EditScheduler = bot.edits  # type: ignore[attr-defined]
+        # Resident rosters (recently clicked) and their indexes; the rest live in the database until clicked
+        self.rosters = RosterRegistry()
+        # Route every roster button (any roster, resident or not) through RosterButton
+        self.bot.add_dynamic_items(RosterButton)
+        self.display_updates = UpdateCoalescer(ROSTER_UPDATE_WINDOW, name="roster-embed")
+        self.evicted = 0
+        self.rehydrated = 0
+        self.roster_eviction_task.start()
         self.bot.loop.create_task(self._restore_rosters())
         logger.info("RosterCog initialized")
     
-    def cog_unload(self):
+    async def cog_unload(self):
         logger.info("Unloading RosterCog...")
-        self.roster_refresh_task.cancel()
+        self.roster_eviction_task.cancel()
+        self.display_updates.cancel_all()
+        logger.info(f"Roster embed updates: {self.display_updates.stats()}")
+        self.bot.remove_dynamic_items(RosterButton)
     
     async def cog_app_command_error(self, interaction: discord.Interaction, error: Exception):
         # Handle errors in app commands
@@ -475,48 +689,152 @@ class RosterCog(commands.Cog):
             logger.error("Failed to send error message to user")
     
     async def _restore_rosters(self):
-        # Restore rosters from database on startup
+        # Bring rosters used in the last ROSTER_IDLE_DAYS back into memory; older ones stay in the database
+        # and are loaded on their next click. Buttons need no registration (RosterButton routes by custom_id),
+        # and message references come from the channel cache once the bot is ready, without REST calls.
         await self.bot.wait_until_ready()
-        await self.db.initialize()
         
-        rosters_data = await self.db.load_rosters()
-        logger.info(f"Restoring {len(rosters_data)} rosters from database")
+        for custom_id, channel_id, message_id in await self.db.load_roster_messages():
+            self.rosters.locations.add(custom_id, channel_id, message_id)
+        
+        # Rosters saved before guild_id was stored take their channel's guild, so guild-scoped lookups
+        # (/my_rosters, /roster_delete) find them; channels that don't resolve are left for later
+        channel_guilds: Dict[int, int] = {}
+        for channel_id in await self.db.load_roster_channels_without_guild():
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None and getattr(channel, "guild", None) is not None:
+                channel_guilds[channel_id] = channel.guild.id
+        if channel_guilds:
+            await self.db.backfill_roster_guilds(channel_guilds)
+            logger.info(f"Backfilled the guild of rosters in {len(channel_guilds)} channel(s)")
         
+        active_since = datetime.utcnow() - timedelta(days=ROSTER_IDLE_DAYS)
+        rosters_data = await self.db.load_rosters(active_since=active_since)
+        logger.info(f"Restoring {len(rosters_data)} recently active roster(s) from database")
+        
+        restored: List[Roster] = []
         for data in rosters_data:
             try:
-                # Fetch the message
-                channel = self.bot.get_channel(data["channel_id"])
-                if not channel:
-                    logger.warning(f"Channel {data['channel_id']} not found for roster {data['custom_id']}")
-                    continue
-                
-                try:
-                    message = await channel.fetch_message(data["message_id"])
-                except discord.NotFound:
-                    logger.warning(f"Message {data['message_id']} not found, deleting roster {data['custom_id']}")
-                    await self.db.delete_roster(data["custom_id"])
+                roster = await self._roster_from_data(data)
+                if roster is None:
                     continue
-                
-                # Recreate the view
-                view = RosterMainView(self, data["custom_id"])
-                view.title = data["title"]
-                view.date_time = data["date_time"]
-                view.description = data["description"]
-                view.limit = data["roster_limit"]
-                view.thumbnail = data["thumbnail"]
-                view.participants = data["participants"]
-                view.roster_message = message
-                view.channel_id = data["channel_id"]
-                view.message_id = data["message_id"]
-                
-                # Re-attach the view to the message
-                self.bot.add_view(view, message_id=message.id)
-                await self._migrate_legacy_roster_view(message, view)
-                self.active_rosters[data["custom_id"]] = view
-                
-                logger.info(f"Restored roster {data['custom_id']} with {len(view.participants)} participants")
+                restored.append(roster)
+                logger.info(f"Restored roster {roster.custom_id} with {len(roster.participants)} participants")
             except Exception as e:
                 logger.error(f"Failed to restore roster {data.get('custom_id', 'unknown')}: {e}")
+        
+        self.bot.loop.create_task(self._validate_restored_rosters(restored))
+    
+    def _data_guild_id(self, data: dict) -> Optional[int]:
+        # Guild of a roster row; rows saved before guild_id was stored use their channel's guild
+        if data["guild_id"] is not None:
+            return data["guild_id"]
+        channel = self.bot.get_channel(data["channel_id"])
+        guild = getattr(channel, "guild", None)
+        return guild.id if guild is not None else None
+    
+    async def _roster_from_data(self, data: dict) -> Optional[Roster]:
+        # Rebuild a resident roster from a database row (backfilling a missing guild_id)
+        existing = self.rosters.get(data["custom_id"])
+        if existing is not None:
+            return existing
+        
+        channel = self.bot.get_channel(data["channel_id"])
+        if not channel:
+            logger.warning(f"Channel {data['channel_id']} not found for roster {data['custom_id']}")
+            return None
+        
+        roster = Roster(self, data["custom_id"])
+        roster.title = data["title"]
+        roster.date_time = data["date_time"]
+        roster.description = data["description"]
+        roster.limit = data["roster_limit"]
+        roster.thumbnail = data["thumbnail"]
+        roster.set_participants(data["participants"])
+        roster.channel_id = data["channel_id"]
+        roster.message_id = data["message_id"]
+        roster.guild_id = self._data_guild_id(data)
+        # PartialMessage: no fetch, resolved by the API only when we edit
+        roster.roster_message = channel.get_partial_message(roster.message_id)
+        
+        self.rosters.add(roster)
+        if data["guild_id"] is None and roster.guild_id is not None:
+            await self.save_roster_to_db(roster)
+        return roster
+    
+    async def _get_roster(
+        self,
+        custom_id: Optional[str],
+        message_id: Optional[int] = None,
+        guild_id: Optional[int] = None
+    ) -> Optional[Roster]:
+        # Resident roster by id, otherwise loaded from the database (by id, or by message id for legacy buttons).
+        # With guild_id, rosters of other guilds are not returned, and their rows are never made resident.
+        if custom_id is not None:
+            roster = self.rosters.get(custom_id)
+            data = None if roster is not None else await self.db.load_roster(custom_id)
+        elif message_id is not None:
+            roster = self.rosters.get(self.rosters.by_message(message_id))
+            data = None if roster is not None else await self.db.load_roster_by_message(message_id)
+        else:
+            return None
+        if roster is not None:
+            return roster if guild_id is None or roster.guild_id == guild_id else None
+        if data is None or (guild_id is not None and self._data_guild_id(data) != guild_id):
+            return None
+        
+        roster = await self._roster_from_data(data)
+        if roster is not None:
+            self.rehydrated += 1
+            logger.info(f"Rehydrated roster {roster.custom_id} from database")
+        return roster
+    
+    async def handle_click(self, interaction: discord.Interaction, roster_id: Optional[str], action: str):
+        # Entry point for every roster button click (see RosterButton)
+        message_id = interaction.message.id if interaction.message else None
+        roster = await self._get_roster(roster_id, message_id)
+        if roster is None:
+            await interaction.response.send_message("❌ This roster no longer exists.", ephemeral=True)
+            return
+        
+        roster.last_active = time.monotonic()
+        if action == "interested":
+            await roster.on_interested(interaction)
+        elif action == "remove":
+            await roster.on_remove(interaction)
+        else:
+            await roster.on_list(interaction)
+    
+    def roster_stats(self) -> Dict[str, int]:
+        return {
+            "resident": len(self.rosters),
+            "stored": len(self.rosters.locations),
+            "evicted": self.evicted,
+            "rehydrated": self.rehydrated,
+        }
+    
+    async def _validate_restored_rosters(self, rosters: List[Roster]):
+        # Background check (bounded concurrency) that restored roster messages still exist,
+        # migrating legacy shared button ids on the way
+        semaphore = asyncio.Semaphore(RESTORE_VALIDATE_CONCURRENCY)
+        
+        async def validate(roster: Roster):
+            if not roster.roster_message:
+                return
+            async with semaphore:
+                try:
+                    message = await self.edits.fetch(roster.roster_message)
+                except discord.NotFound:
+                    # Deleted while the bot was offline (deletions while online arrive as events)
+                    await self._purge_rosters({roster.custom_id}, f"message {roster.message_id} not found")
+                    return
+                except (discord.HTTPException, OSError) as e:
+                    logger.warning(f"Could not validate roster {roster.custom_id}: {e}")
+                    return
+                await self._migrate_legacy_roster_buttons(message, roster)
+        
+        await asyncio.gather(*(validate(roster) for roster in rosters))
+        logger.info(f"Validated {len(rosters)} restored roster(s)")
 
     def _has_legacy_roster_buttons(self, message: discord.Message) -> bool:
         legacy_ids = {"roster_interested", "roster_remove"}
@@ -526,79 +844,95 @@ class RosterCog(commands.Cog):
                     return True
         return False
 
-    async def _migrate_legacy_roster_view(self, message: discord.Message, view: RosterMainView):
-        # Update old messages that used shared custom_ids so they don't collide on restart
+    async def _migrate_legacy_roster_buttons(self, message: discord.Message, roster: Roster):
+        # Swap old shared custom_ids for ones that encode the roster id (routable after eviction)
         if not self._has_legacy_roster_buttons(message):
             return
         try:
-            await message.edit(view=view)
-            logger.info(f"Migrated legacy roster buttons for {view.custom_id}")
+            await self.edits.edit(message, view=roster.build_view())
+            logger.info(f"Migrated legacy roster buttons for {roster.custom_id}")
         except discord.Forbidden as e:
-            logger.error(f"No permission to update roster buttons for {view.custom_id}: {e}")
+            logger.error(f"No permission to update roster buttons for {roster.custom_id}: {e}")
         except discord.HTTPException as e:
-            logger.error(f"Failed to update roster buttons for {view.custom_id}: {e}")
+            logger.error(f"Failed to update roster buttons for {roster.custom_id}: {e}")
     
-    async def save_roster_to_db(self, view: RosterMainView):
+    async def save_roster_to_db(self, roster: Roster):
         # Save a roster to the database
-        if not view.roster_message:
+        if not roster.roster_message:
             return
         
         await self.db.save_roster(
-            custom_id=view.custom_id,
-            title=view.title,
-            date_time=view.date_time,
-            description=view.description,
-            channel_id=view.channel_id,
-            message_id=view.message_id,
-            participants=view.participants,
-            roster_limit=view.limit,
-            thumbnail=view.thumbnail
+            custom_id=roster.custom_id,
+            title=roster.title,
+            date_time=roster.date_time,
+            description=roster.description,
+            channel_id=roster.channel_id,
+            message_id=roster.message_id,
+            roster_limit=roster.limit,
+            thumbnail=roster.thumbnail,
+            guild_id=roster.guild_id
         )
     
-    @tasks.loop(hours=1)
-    async def roster_refresh_task(self):
-        # Background task to validate rosters periodically (not refresh messages)
-        # This only checks if messages still exist, doesn't update them
-        logger.info(f"Running roster validation check for {len(self.active_rosters)} rosters")
-        
-        for custom_id, view in list(self.active_rosters.items()):
-            try:
-                # Only verify message existence, don't fetch/update
-                if view.channel_id and view.message_id:
-                    channel = self.bot.get_channel(view.channel_id)
-                    if not channel:
-                        logger.warning(f"Channel missing for roster {custom_id}, removing from active rosters")
-                        del self.active_rosters[custom_id]
-                        continue
-                    
-                    # Light check - only verify if message was deleted
-                    # Don't fetch message unless necessary
-                    if not view.roster_message:
-                        try:
-                            message = await channel.fetch_message(view.message_id)
-                            view.roster_message = message
-                            logger.info(f"Recovered message reference for roster {custom_id}")
-                        except discord.NotFound:
-                            logger.warning(f"Roster message {custom_id} was deleted, removing from active rosters")
-                            await self.db.delete_roster(custom_id)
-                            del self.active_rosters[custom_id]
-                        except discord.HTTPException as e:
-                            if e.status != 429:  # Ignore rate limits here
-                                logger.error(f"Error validating roster {custom_id}: {e}")
-                        except OSError as e:
-                            logger.warning(f"Network error validating roster {custom_id}: {e}")
-            except Exception as e:
-                logger.error(f"Error in roster validation for {custom_id}: {e}")
+    async def save_roster_participant(self, roster: Roster, user_id: int):
+        # Persist a single participant's join (or skill change)
+        if not roster.roster_message:
+            return
         
-        logger.info(f"Roster validation complete. {len(self.active_rosters)} active rosters")
+        username, skill_level = roster.participants[user_id]
+        await self.db.save_roster_participant(roster.custom_id, user_id, username, skill_level)
     
-    @roster_refresh_task.error
-    async def roster_refresh_task_error(self, error: Exception):
-        # Handle task-level errors to prevent task from stopping
-        logger.error(f"Roster validation task encountered an error: {error}", exc_info=True)
+    async def delete_roster_participant(self, roster: Roster, user_id: int):
+        # Persist a single participant's removal
+        await self.db.delete_roster_participant(roster.custom_id, user_id)
     
-    @roster_refresh_task.before_loop
-    async def before_roster_refresh(self):
+    async def _purge_rosters(self, custom_ids: Set[str], reason: str):
+        # Forget rosters whose message or channel is gone: memory, pending edits and database rows
+        for custom_id in custom_ids:
+            self.rosters.remove(custom_id)
+            self.display_updates.cancel(custom_id)
+            await self.db.delete_roster(custom_id)
+            logger.info(f"Removed roster {custom_id} ({reason})")
+    
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        custom_id = self.rosters.by_message(payload.message_id)
+        if custom_id:
+            await self._purge_rosters({custom_id}, "message deleted")
+    
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        custom_ids = self.rosters.by_messages(payload.message_ids)
+        if custom_ids:
+            await self._purge_rosters(custom_ids, "message bulk-deleted")
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        custom_ids = self.rosters.in_channel(channel.id)
+        if custom_ids:
+            await self._purge_rosters(custom_ids, f"channel {channel.id} deleted")
+    
+    @tasks.loop(hours=1)
+    async def roster_eviction_task(self):
+        # Drop rosters nobody has clicked for ROSTER_IDLE_DAYS from memory (their state is already in the
+        # database; pending writes are in the write-behind queue). A later click loads them again.
+        idle_after = ROSTER_IDLE_DAYS * 86400
+        now = time.monotonic()
+        evicted = 0
+        for roster in self.rosters.values():
+            if now - roster.last_active < idle_after or self.display_updates.is_pending(roster.custom_id):
+                continue
+            self.rosters.evict(roster.custom_id)
+            evicted += 1
+        self.evicted += evicted
+        
+        stored = await self.db.count_rosters()
+        logger.info(
+            f"Rosters: {len(self.rosters)} resident / {stored} stored "
+            f"(evicted {evicted} idle this run; {self.evicted} evicted, {self.rehydrated} rehydrated since start)"
+        )
+    
+    @roster_eviction_task.before_loop
+    async def before_roster_eviction(self):
         await self.bot.wait_until_ready()
     
     @app_commands.default_permissions(manage_guild=True)
@@ -610,18 +944,19 @@ class RosterCog(commands.Cog):
             
             logger.info(f"Creating roster (ID: {custom_id}) by {interaction.user}")
             
-            # Create the main view for this roster
-            roster_view = RosterMainView(self, custom_id)
+            # Create the roster
+            roster = Roster(self, custom_id)
             
             # Show configuration modal
             modal = RosterConfigModal()
-            modal.view = roster_view  # Pass the view to the modal
+            modal.roster = roster  # Pass the roster to the modal
             
             await interaction.response.send_modal(modal)
         except Exception as e:
             logger.error(f"Failed to start roster: {e}", exc_info=True)
             raise
     
+    @app_commands.guild_only()
     @app_commands.default_permissions(manage_guild=True)
     @app_commands.command(name="roster_delete", description="Delete a roster (admin only)")
     @app_commands.describe(message_id="The message ID of the roster to delete")
@@ -630,37 +965,32 @@ class RosterCog(commands.Cog):
         try:
             msg_id = int(message_id)
             
-            # Find the roster
-            roster_to_delete = None
-            for custom_id, view in self.active_rosters.items():
-                if view.message_id == msg_id:
-                    roster_to_delete = (custom_id, view)
-                    break
+            # Find the roster (resident, or loaded from the database if it was evicted). Only rosters of this
+            # server: message IDs are global, so another server's roster would match too.
+            roster = await self._get_roster(None, msg_id, guild_id=interaction.guild_id)
             
-            if not roster_to_delete:
+            if not roster:
                 await interaction.response.send_message(
                     "❌ Roster not found. Make sure the message ID is correct.",
                     ephemeral=True
                 )
                 return
             
-            custom_id, view = roster_to_delete
+            custom_id = roster.custom_id
             
-            # Delete from database
-            await self.db.delete_roster(custom_id)
-            
-            # Remove from active rosters
-            del self.active_rosters[custom_id]
+            # Remove from memory and the database
+            await self._purge_rosters({custom_id}, "deleted by admin")
             
             # Try to delete the message
-            if view.roster_message:
+            if roster.roster_message:
                 try:
-                    await view.roster_message.delete()
+                    message = roster.roster_message
+                    await self.edits.submit(message.channel.id, message.delete, priority=EditPriority.INTERACTION)
                 except discord.HTTPException:
                     pass
             
             await interaction.response.send_message(
-                f"✅ Roster deleted successfully.",
+                "✅ Roster deleted successfully.",
                 ephemeral=True
             )
             logger.info(f"Deleted roster {custom_id}")
@@ -671,6 +1001,44 @@ class RosterCog(commands.Cog):
                 ephemeral=True
             )
 
+    @app_commands.guild_only()
+    @app_commands.command(name="my_rosters", description="List the rosters you've signed up for")
+    async def my_rosters(self, interaction: discord.Interaction):
+        # Resident rosters come from the participant index; the rest from the indexed database lookup
+        guild_id = interaction.guild_id
+        user_id = interaction.user.id
+
+        entries: Dict[str, dict] = {}
+        for roster in self.rosters.for_user(user_id):
+            if roster.guild_id == guild_id:
+                entries[roster.custom_id] = {
+                    "title": roster.title,
+                    "date_time": roster.date_time,
+                    "channel_id": roster.channel_id,
+                    "message_id": roster.message_id,
+                    "skill_level": roster.participants[user_id][1],
+                }
+        if not self.rosters.all_resident:
+            for row in await self.db.load_user_rosters(user_id, guild_id):
+                # Resident state is newer than the database (writes are queued), so it wins
+                if row["custom_id"] not in self.rosters:
+                    entries[row["custom_id"]] = row
+
+        if not entries:
+            await interaction.response.send_message("You're not on any roster in this server.", ephemeral=True)
+            return
+
+        lines = [
+            f"**[{entry['title']}](https://discord.com/channels/{guild_id}/{entry['channel_id']}/{entry['message_id']})**"
+            f" · {entry['date_time']} · {entry['skill_level']}"
+            for entry in entries.values()
+        ]
+        embed = discord.Embed(title="📋 Your Rosters", color=discord.Color.blue())
+        embed.description, shown = _chunk_lines(lines, EMBED_DESCRIPTION_LIMIT)[0]
+        if shown < len(lines):
+            embed.set_footer(text=f"Showing {shown} of {len(lines)} rosters")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(RosterCog(bot))
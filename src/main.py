@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import signal
 import sys
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
@@ -9,6 +11,9 @@ from discord.ext import commands
 from discord import app_commands
 
 from .config import load_config, Config
+from .utils.database import Database
+from .utils.edit_scheduler import EditScheduler
+from .utils.member_index import MemberIndex
 
 # Configure logging with timestamps and better formatting
 logging.basicConfig(
@@ -28,6 +33,14 @@ class CybersecBot(commands.Bot):
 
         super().__init__(command_prefix="!", intents=intents)
         self.config = config
+        # Shared data service injected into every cog (opened in setup_hook)
+        self.db = Database(Path(config.database_path))
+        # Per-guild member/role index for cheap permission-style checks (kept current by member events)
+        self.member_index = MemberIndex()
+        # Bot-wide queue for message edits/fetches: per-channel rate buckets, coalescing and priorities
+        self.edits = EditScheduler()
+        # The single shutdown sequence (see close), however it was triggered
+        self._shutdown: Optional[asyncio.Task] = None
 
     async def setup_hook(self) -> None:
         # Load all cogs with error handling
@@ -35,6 +48,19 @@ class CybersecBot(commands.Bot):
         logger.info("Starting bot setup...")
         logger.info("========================================")
         
+        # Open the shared database once, before any cog needs it
+        try:
+            await self.db.initialize()
+        except Exception as e:
+            logger.critical(f"❌ Failed to initialize database at {self.db.db_path}: {e}", exc_info=True)
+            raise
+        
+        # docker stop sends SIGTERM, which would otherwise kill the process without flushing queued writes
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._on_sigterm)
+        except (NotImplementedError, RuntimeError):
+            logger.warning("SIGTERM handler not supported on this platform; stop the bot with Ctrl+C")
+        
         # Load cogs with individual error handling
         cogs = [
             ("verification", "VerificationCog"),
@@ -80,6 +106,28 @@ class CybersecBot(commands.Bot):
                 logger.error(f"Sync command failed: {e}")
                 await interaction.followup.send(f"❌ Sync failed: {e}", ephemeral=True)
 
+    def _on_sigterm(self):
+        logger.info("👋 Bot shutdown requested (SIGTERM)")
+        asyncio.create_task(self.close())
+
+    async def close(self):
+        # Runs the shutdown once; every caller (SIGTERM, Ctrl+C, the runner exiting) waits for it to finish,
+        # so the process never exits before the database is flushed. Shielded: a caller being cancelled
+        # doesn't interrupt the flush.
+        if self._shutdown is None:
+            self._shutdown = asyncio.create_task(self._close())
+        await asyncio.shield(self._shutdown)
+
+    async def _close(self):
+        # Unload cogs and disconnect first so their final writes are queued, then flush and close the database
+        await super().close()
+        await self.edits.close()
+        await self.db.close()
+
+    async def __aexit__(self, *exc_info) -> None:
+        # discord.py's runner only waits for its own closing task, which ends before the database flush
+        await self.close()
+
     async def on_ready(self):
         # Called when the bot is ready and connected
         logger.info("========================================")
@@ -132,6 +180,19 @@ class CybersecBot(commands.Bot):
     async def on_guild_remove(self, guild: discord.Guild):
         # Log when bot leaves a guild
         logger.warning(f"👋 Removed from guild: {guild.name} (ID: {guild.id})")
+        self.member_index.drop_guild(guild.id)
+    
+    async def on_member_join(self, member: discord.Member):
+        # Keep the member index current
+        self.member_index.upsert(member)
+    
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # Keep the member index current (role changes)
+        self.member_index.upsert(after)
+    
+    async def on_member_remove(self, member: discord.Member):
+        # Keep the member index current
+        self.member_index.remove(member.guild.id, member.id)
 
 
 def main():
@@ -0,0 +1,94 @@
+# Per-key update coalescer: collapses bursts of update requests into at most one call per window
+# The first request runs immediately; requests arriving during the window collapse into one trailing call,
+# and because the callback renders current state when it runs, the last call always reflects the final state
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger("bot.coalescer")
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    # Seconds to back off if error is a rate limit (discord.RateLimited or an HTTP 429), else None
+    delay = getattr(error, "retry_after", None)
+    if delay is not None:
+        return float(delay)
+    if getattr(error, "status", None) == 429:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After", 5))
+        except (TypeError, ValueError):
+            return 5.0
+    return None
+
+
+class UpdateCoalescer:
+    def __init__(self, window: float, name: str = "coalescer"):
+        self.window = window
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._dirty: Set[Hashable] = set()
+
+        # Metrics: updates asked for vs. actually performed, and rate-limit backoffs
+        self.requested = 0
+        self.sent = 0
+        self.rate_limited = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requested": self.requested,
+            "sent": self.sent,
+            "rate_limited": self.rate_limited,
+            "in_flight": len(self._tasks),
+        }
+
+    def request(self, key: Hashable, update: Callable[[], Awaitable[None]]):
+        # Ask for an update of key; never blocks the caller
+        self.requested += 1
+        if key in self._tasks:
+            self._dirty.add(key)
+            return
+        self._tasks[key] = asyncio.create_task(self._run(key, update))
+
+    def is_pending(self, key: Hashable) -> bool:
+        # Whether an update for key is running or waiting out its window
+        return key in self._tasks
+
+    def cancel(self, key: Hashable):
+        # Drop any pending update for key
+        self._dirty.discard(key)
+        task = self._tasks.pop(key, None)
+        if task:
+            task.cancel()
+
+    def cancel_all(self):
+        for key in list(self._tasks):
+            self.cancel(key)
+
+    async def _run(self, key: Hashable, update: Callable[[], Awaitable[None]]):
+        try:
+            while True:
+                self._dirty.discard(key)
+                delay = self.window
+                try:
+                    await update()
+                    self.sent += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    backoff = retry_after(e)
+                    if backoff is None:
+                        logger.error(f"{self.name}: update for {key} failed: {e}")
+                    else:
+                        # Rate limited: wait as long as Discord asked, then send the (current) state again
+                        self.rate_limited += 1
+                        logger.warning(f"{self.name}: rate limited on {key}, retrying in {backoff:.2f}s")
+                        self._dirty.add(key)
+                        delay = max(delay, backoff)
+                await asyncio.sleep(delay)
+                if key not in self._dirty:
+                    break
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
@@ -1,11 +1,13 @@
 # Database module for persistent storage of giveaways and rosters
 # Uses SQLite with aiosqlite for async operations
 import aiosqlite
+import asyncio
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger("bot.database")
 
@@ -13,13 +15,187 @@ logger = logging.getLogger("bot.database")
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "bot.db"
 
 
+# Seconds SQLite waits on a locked database before raising "database is locked"
+BUSY_TIMEOUT = 5.0
+
+# Write-behind queue: flush queued mutations this often, or sooner once this many are pending
+FLUSH_INTERVAL = 0.25
+FLUSH_MAX_OPS = 200
+
+# A queued mutation: the statements to run, in order, as one unit
+Statements = List[Tuple[str, tuple]]
+
+
 class Database:
     # Async SQLite database wrapper for bot persistence
-    def __init__(self, db_path: Path = DB_PATH):
+    # Owns a single long-lived connection (one aiosqlite worker thread) opened in initialize()
+    # Mutations are write-behind: queued, coalesced per row (latest wins) and group-committed
+    def __init__(
+        self,
+        db_path: Path = DB_PATH,
+        flush_interval: float = FLUSH_INTERVAL,
+        flush_max_ops: int = FLUSH_MAX_OPS
+    ):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        # Serializes statements + commit so concurrent coroutines don't interleave transactions
+        self._lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
+        
+        # Pending mutations keyed by the row they touch; insertion order is the order of the latest write
+        self.flush_interval = flush_interval
+        self.flush_max_ops = flush_max_ops
+        self._pending: Dict[tuple, Statements] = {}
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set by close(): the flush loop finishes any in-progress flush and exits instead of being cancelled
+        self._closing = False
+        
+        # Read-through cache of active giveaways (None until first load), kept in sync by every mutation.
+        # Rosters aren't cached here: RosterCog keeps the recently used ones resident and loads the rest on demand.
+        self._giveaway_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        
+        # Metrics
+        self.ops_queued = 0
+        self.ops_coalesced = 0
+        self.ops_flushed = 0
+        self.flushes = 0
+    
+    @property
+    def queue_depth(self) -> int:
+        # Number of row mutations waiting to be written
+        return len(self._pending)
+    
+    def stats(self) -> Dict[str, int]:
+        # Snapshot of write-behind queue metrics
+        return {
+            "queue_depth": self.queue_depth,
+            "ops_queued": self.ops_queued,
+            "ops_coalesced": self.ops_coalesced,
+            "ops_flushed": self.ops_flushed,
+            "flushes": self.flushes,
+        }
+    
+    async def _connection(self) -> aiosqlite.Connection:
+        # Return the shared connection, opening it on first use
+        if self._conn is None:
+            await self.initialize()
+        return self._conn
+    
+    async def _open(self):
+        # Open the long-lived connection and tune it for many small writes
+        self._conn = await aiosqlite.connect(self.db_path, timeout=BUSY_TIMEOUT)
+        self._conn.row_factory = aiosqlite.Row
+        await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}")
+    
+    async def close(self):
+        # Flush queued writes, then close the shared connection (called on cog unload / shutdown)
+        if self._flush_task:
+            # Stop the loop cooperatively: cancelling it mid group-commit would lose the batch it holds
+            self._closing = True
+            self._wakeup.set()
+            self._full.set()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            self._closing = False
+        if self._conn is None:
+            return
+        await self.flush()
+        logger.info(f"Database write-behind stats: {self.stats()}")
+        try:
+            await self._conn.close()
+            logger.info(f"Database connection closed ({self.db_path})")
+        except Exception as e:
+            logger.error(f"Failed to close database connection: {e}")
+        finally:
+            self._conn = None
     
     async def initialize(self):
-        # Create tables if they don't exist
+        # Open the connection and create tables if they don't exist (safe to call more than once)
+        async with self._init_lock:
+            if self._conn is not None:
+                return
+            await self._initialize()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    # === WRITE-BEHIND QUEUE ===
+    
+    def _enqueue(self, key: tuple, statements: Statements):
+        # Queue a row mutation; a newer mutation of the same row replaces the older one
+        if self._pending.pop(key, None) is not None:
+            self.ops_coalesced += 1
+        self._pending[key] = statements
+        self.ops_queued += 1
+        self._wakeup.set()
+        if len(self._pending) >= self.flush_max_ops:
+            self._full.set()
+    
+    async def _flush_loop(self):
+        # Background task: group-commit pending mutations every flush_interval or when the queue fills
+        while not self._closing:
+            try:
+                await self._wakeup.wait()
+                if self._closing:
+                    break
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Database flush loop error: {e}")
+    
+    async def flush(self):
+        # Write every pending mutation in a single transaction
+        if not self._pending:
+            return
+        db = await self._connection()
+        async with self._lock:
+            batch = self._pending
+            self._pending = {}
+            self._wakeup.clear()
+            self._full.clear()
+            if not batch:
+                return
+            
+            try:
+                for statements in batch.values():
+                    for sql, params in statements:
+                        await db.execute(sql, params)
+                await db.commit()
+            except asyncio.CancelledError:
+                # Interrupted before the commit finished: roll back and put the batch back in front of anything
+                # queued since (newer writes of the same row still win), so the next flush writes it
+                self._pending = {**batch, **self._pending}
+                self._wakeup.set()
+                await db.rollback()
+                raise
+            except Exception as e:
+                # Isolate the bad mutation: retry one by one so a single failure doesn't drop the batch
+                logger.error(f"Group commit of {len(batch)} mutation(s) failed, retrying individually: {e}")
+                await db.rollback()
+                for key, statements in batch.items():
+                    try:
+                        for sql, params in statements:
+                            await db.execute(sql, params)
+                        await db.commit()
+                    except Exception as op_e:
+                        await db.rollback()
+                        logger.error(f"Dropping failed database write {key}: {op_e}")
+            
+            self.ops_flushed += len(batch)
+            self.flushes += 1
+            logger.debug(f"Flushed {len(batch)} database mutation(s), queue depth now {self.queue_depth}")
+    
+    async def _initialize(self):
         # Create database directory if it doesn't exist
         try:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -34,37 +210,245 @@ class Database:
             self.db_path = Path(tempfile.gettempdir()) / "bot.db"
             logger.warning(f"Using temporary database location: {self.db_path}")
         
-        async with aiosqlite.connect(self.db_path) as db:
-            # Giveaways table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS giveaways (
-                    custom_id TEXT PRIMARY KEY,
-                    prize TEXT NOT NULL,
-                    end_time TEXT NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    message_id INTEGER NOT NULL,
-                    entries TEXT NOT NULL,
-                    is_ended INTEGER DEFAULT 0
-                )
-            """)
-            
-            # Rosters table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS rosters (
-                    custom_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    date_time TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    roster_limit INTEGER,
-                    thumbnail TEXT,
-                    channel_id INTEGER NOT NULL,
-                    message_id INTEGER NOT NULL,
-                    participants TEXT NOT NULL
-                )
-            """)
-            
-            await db.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+        await self._open()
+        async with self._lock:
+            await self._run_migrations(self._conn)
+        logger.info(f"Database initialized at {self.db_path}")
+    
+    # === SCHEMA MIGRATIONS ===
+    # Each step runs in its own transaction and bumps PRAGMA user_version; append new steps, never edit old ones
+    
+    def _migrations(self):
+        return [
+            ("base tables", self._migration_1_base_tables),
+            ("guild_id/created_at columns and indexes", self._migration_2_guild_created_indexes),
+            ("multi-winner draws and weighted entries", self._migration_3_winners_and_weights),
+            ("giveaway entry requirements", self._migration_4_giveaway_requirements),
+            ("giveaway results history", self._migration_5_giveaway_history),
+            ("roster last activity", self._migration_6_roster_last_active),
+            ("message/channel lookup indexes", self._migration_7_message_channel_indexes),
+            ("roster participant user index", self._migration_8_roster_participant_user_index),
+            ("calendar reminder ledger", self._migration_9_calendar_reminders),
+        ]
+    
+    async def _run_migrations(self, db: aiosqlite.Connection):
+        # Apply every migration newer than the database's user_version
+        async with db.execute("PRAGMA user_version") as cursor:
+            current = (await cursor.fetchone())[0]
+        
+        migrations = self._migrations()
+        for version, (name, step) in enumerate(migrations, start=1):
+            if version <= current:
+                continue
+            started = time.perf_counter()
+            try:
+                await db.execute("BEGIN")
+                await step(db)
+                await db.execute(f"PRAGMA user_version = {version}")
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.error(f"❌ Database migration {version} ({name}) failed, rolled back")
+                raise
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"Applied database migration {version} ({name}) in {elapsed_ms:.1f}ms")
+        
+        if current > len(migrations):
+            logger.warning(f"Database schema version {current} is newer than this bot ({len(migrations)})")
+    
+    async def _migration_1_base_tables(self, db: aiosqlite.Connection):
+        # Tables as of the pre-versioned schema (IF NOT EXISTS, so existing databases adopt version 1)
+        # Giveaways table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS giveaways (
+                custom_id TEXT PRIMARY KEY,
+                prize TEXT NOT NULL,
+                end_time TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                entries TEXT NOT NULL,
+                is_ended INTEGER DEFAULT 0
+            )
+        """)
+        
+        # Rosters table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS rosters (
+                custom_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                date_time TEXT NOT NULL,
+                description TEXT NOT NULL,
+                roster_limit INTEGER,
+                thumbnail TEXT,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                participants TEXT NOT NULL
+            )
+        """)
+        
+        # Giveaway entries (one row per entrant, so an entry is a single-row write)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS giveaway_entries (
+                giveaway_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                entered_at TEXT NOT NULL,
+                PRIMARY KEY (giveaway_id, user_id)
+            ) WITHOUT ROWID
+        """)
+        
+        # Roster participants (one row per member, so join/leave is a single-row write)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS roster_participants (
+                roster_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                username TEXT NOT NULL,
+                skill_level TEXT NOT NULL,
+                joined_at TEXT NOT NULL,
+                PRIMARY KEY (roster_id, user_id)
+            )
+        """)
+        
+        await self._migrate_legacy_giveaway_entries(db)
+        await self._migrate_legacy_roster_participants(db)
+    
+    async def _migration_2_guild_created_indexes(self, db: aiosqlite.Connection):
+        # Ownership/age columns, backfilled with the migration time for existing rows
+        now = datetime.utcnow().isoformat()
+        for table in ("giveaways", "rosters"):
+            await db.execute(f"ALTER TABLE {table} ADD COLUMN guild_id INTEGER")
+            await db.execute(f"ALTER TABLE {table} ADD COLUMN created_at TEXT")
+            await db.execute(f"UPDATE {table} SET created_at = ? WHERE created_at IS NULL", (now,))
+        
+        # load_giveaways (is_ended = 0) and cleanup_old_entries (is_ended = 1 AND end_time < ?)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_ended_end ON giveaways(is_ended, end_time)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_guild ON giveaways(guild_id, created_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_rosters_guild ON rosters(guild_id, created_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_rosters_message ON rosters(message_id)")
+    
+    async def _migration_3_winners_and_weights(self, db: aiosqlite.Connection):
+        # Winner count, per-role entry weights (JSON {role_id: weight}) and drawn winners (JSON list)
+        await db.execute("ALTER TABLE giveaways ADD COLUMN winner_count INTEGER NOT NULL DEFAULT 1")
+        await db.execute("ALTER TABLE giveaways ADD COLUMN role_weights TEXT NOT NULL DEFAULT '{}'")
+        await db.execute("ALTER TABLE giveaways ADD COLUMN winners TEXT NOT NULL DEFAULT '[]'")
+        # Weight is fixed when the user enters, from their roles at that moment
+        await db.execute("ALTER TABLE giveaway_entries ADD COLUMN weight INTEGER NOT NULL DEFAULT 1")
+    
+    async def _migration_4_giveaway_requirements(self, db: aiosqlite.Connection):
+        # Entry requirements as JSON (required_role_id, verified_role_id, min_member_days)
+        await db.execute("ALTER TABLE giveaways ADD COLUMN requirements TEXT NOT NULL DEFAULT '{}'")
+    
+    async def _migration_5_giveaway_history(self, db: aiosqlite.Connection):
+        # Archive of ended giveaways (winners, entry count, timing), paged newest-first per guild
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS giveaway_history (
+                giveaway_id TEXT PRIMARY KEY,
+                guild_id INTEGER,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                prize TEXT NOT NULL,
+                winners TEXT NOT NULL,
+                entry_count INTEGER NOT NULL,
+                started_at TEXT,
+                end_time TEXT NOT NULL,
+                ended_at TEXT NOT NULL
+            )
+        """)
+        # Keyset pagination: WHERE guild_id = ? AND (ended_at, giveaway_id) < (?, ?) ORDER BY ended_at DESC
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_giveaway_history_guild_ended
+            ON giveaway_history(guild_id, ended_at, giveaway_id)
+        """)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaway_history_ended ON giveaway_history(ended_at)")
+    
+    async def _migration_6_roster_last_active(self, db: aiosqlite.Connection):
+        # Last join/leave per roster, so startup only loads recently used rosters into memory
+        await db.execute("ALTER TABLE rosters ADD COLUMN last_active_at TEXT")
+        await db.execute("""
+            UPDATE rosters SET last_active_at = COALESCE(
+                (SELECT MAX(joined_at) FROM roster_participants WHERE roster_id = rosters.custom_id),
+                created_at
+            )
+        """)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_rosters_last_active ON rosters(last_active_at)")
+    
+    async def _migration_7_message_channel_indexes(self, db: aiosqlite.Connection):
+        # Locator queries (load_*_messages) and deletions by message/channel
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_message ON giveaways(message_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_channel ON giveaways(channel_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_rosters_channel ON rosters(channel_id)")
+    
+    async def _migration_8_roster_participant_user_index(self, db: aiosqlite.Connection):
+        # Reverse lookup of a member's rosters (load_user_rosters); the primary key only covers roster_id first
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_roster_participants_user ON roster_participants(user_id)")
+    
+    async def _migration_9_calendar_reminders(self, db: aiosqlite.Connection):
+        # Posted calendar reminders, so a restart doesn't post them again; pruned by event start
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS calendar_reminders (
+                reminder_key TEXT PRIMARY KEY,
+                event_start TEXT NOT NULL,
+                posted_at TEXT NOT NULL
+            )
+        """)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_calendar_reminders_start ON calendar_reminders(event_start)")
+    
+    async def _migrate_legacy_giveaway_entries(self, db: aiosqlite.Connection):
+        # Move entries stored as a JSON blob on the giveaways row into giveaway_entries
+        async with db.execute(
+            "SELECT custom_id, entries FROM giveaways WHERE entries != '[]'"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if not rows:
+            return
+        
+        now = datetime.utcnow().isoformat()
+        migrated = 0
+        for row in rows:
+            try:
+                user_ids = json.loads(row["entries"])
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping unreadable legacy entries for giveaway {row['custom_id']}")
+                continue
+            await db.executemany(
+                "INSERT OR IGNORE INTO giveaway_entries (giveaway_id, user_id, entered_at) VALUES (?, ?, ?)",
+                [(row["custom_id"], int(user_id), now) for user_id in user_ids]
+            )
+            await db.execute(
+                "UPDATE giveaways SET entries = '[]' WHERE custom_id = ?", (row["custom_id"],)
+            )
+            migrated += len(user_ids)
+        logger.info(f"Migrated {migrated} legacy giveaway entries from {len(rows)} giveaway(s)")
+    
+    async def _migrate_legacy_roster_participants(self, db: aiosqlite.Connection):
+        # Move participants stored as a JSON blob on the rosters row into roster_participants
+        async with db.execute(
+            "SELECT custom_id, participants FROM rosters WHERE participants != '{}'"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if not rows:
+            return
+        
+        now = datetime.utcnow().isoformat()
+        migrated = 0
+        for row in rows:
+            try:
+                participants_data = json.loads(row["participants"])
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping unreadable legacy participants for roster {row['custom_id']}")
+                continue
+            await db.executemany("""
+                INSERT OR IGNORE INTO roster_participants
+                (roster_id, user_id, username, skill_level, joined_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (row["custom_id"], int(user_id), data["username"], data["skill_level"], now)
+                for user_id, data in participants_data.items()
+            ])
+            await db.execute(
+                "UPDATE rosters SET participants = '{}' WHERE custom_id = ?", (row["custom_id"],)
+            )
+            migrated += len(participants_data)
+        logger.info(f"Migrated {migrated} legacy roster participants from {len(rows)} roster(s)")
     
     # === GIVEAWAY OPERATIONS ===
     
@@ -75,62 +459,251 @@ class Database:
         end_time: datetime,
         channel_id: int,
         message_id: int,
-        entries: set,
-        is_ended: bool = False
+        is_ended: bool = False,
+        guild_id: Optional[int] = None,
+        winner_count: int = 1,
+        role_weights: Optional[Dict[int, int]] = None,
+        winners: Optional[List[int]] = None,
+        requirements: Optional[Dict[str, Any]] = None
     ):
-        # Save or update a giveaway
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO giveaways 
-                    (custom_id, prize, end_time, channel_id, message_id, entries, is_ended)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    custom_id,
-                    prize,
-                    end_time.isoformat(),
-                    channel_id,
-                    message_id,
-                    json.dumps(list(entries)),
-                    1 if is_ended else 0
-                ))
-                await db.commit()
-        except Exception as e:
-            logger.error(f"Failed to save giveaway {custom_id}: {e}")
+        # Queue an upsert of giveaway metadata (entries live in giveaway_entries and are left untouched)
+        role_weights = role_weights or {}
+        winners = winners or []
+        requirements = requirements or {}
+        self._enqueue(("giveaway", custom_id), [("""
+            INSERT INTO giveaways
+            (custom_id, prize, end_time, channel_id, message_id, entries, is_ended, guild_id, created_at,
+             winner_count, role_weights, winners, requirements)
+            VALUES (?, ?, ?, ?, ?, '[]', ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(custom_id) DO UPDATE SET
+                prize = excluded.prize,
+                end_time = excluded.end_time,
+                channel_id = excluded.channel_id,
+                message_id = excluded.message_id,
+                is_ended = excluded.is_ended,
+                guild_id = COALESCE(excluded.guild_id, giveaways.guild_id),
+                winner_count = excluded.winner_count,
+                role_weights = excluded.role_weights,
+                winners = excluded.winners,
+                requirements = excluded.requirements
+        """, (
+            custom_id,
+            prize,
+            end_time.isoformat(),
+            channel_id,
+            message_id,
+            1 if is_ended else 0,
+            guild_id,
+            datetime.utcnow().isoformat(),
+            winner_count,
+            json.dumps({str(role_id): weight for role_id, weight in role_weights.items()}),
+            json.dumps(winners),
+            json.dumps(requirements)
+        ))])
+        
+        if self._giveaway_cache is not None:
+            if is_ended:
+                self._giveaway_cache.pop(custom_id, None)
+            else:
+                cached = self._giveaway_cache.setdefault(custom_id, {"custom_id": custom_id, "entries": {}})
+                cached.update(
+                    prize=prize,
+                    end_time=end_time,
+                    channel_id=channel_id,
+                    message_id=message_id,
+                    is_ended=False,
+                    winner_count=winner_count,
+                    role_weights=dict(role_weights),
+                    winners=list(winners),
+                    requirements=dict(requirements)
+                )
+                if guild_id is not None or "guild_id" not in cached:
+                    cached["guild_id"] = guild_id
+    
+    async def add_giveaway_entry(self, custom_id: str, user_id: int, weight: int = 1):
+        # Queue a single entry; duplicates are ignored by the composite primary key
+        self._enqueue(("giveaway_entry", custom_id, user_id), [(
+            "INSERT OR IGNORE INTO giveaway_entries (giveaway_id, user_id, entered_at, weight) VALUES (?, ?, ?, ?)",
+            (custom_id, user_id, datetime.utcnow().isoformat(), weight)
+        )])
+        
+        if self._giveaway_cache is not None and custom_id in self._giveaway_cache:
+            self._giveaway_cache[custom_id]["entries"].setdefault(user_id, weight)
     
     async def load_giveaways(self) -> List[Dict[str, Any]]:
-        # Load all active giveaways
+        # Load all active giveaways (served from cache after the first load)
+        if self._giveaway_cache is None:
+            rows = await self._fetch_giveaways()
+            if rows is None:
+                return []
+            self._giveaway_cache = {row["custom_id"]: row for row in rows}
+        return [
+            {**row, "entries": dict(row["entries"])}
+            for row in self._giveaway_cache.values()
+        ]
+    
+    async def load_giveaway(self, custom_id: str, include_ended: bool = False) -> Optional[Dict[str, Any]]:
+        # Load one giveaway by id (cache hit for active ones, otherwise a primary-key lookup)
+        if self._giveaway_cache is not None and not include_ended:
+            row = self._giveaway_cache.get(custom_id)
+            return {**row, "entries": dict(row["entries"])} if row else None
+        rows = await self._fetch_giveaways(custom_id, include_ended=include_ended)
+        return rows[0] if rows else None
+    
+    async def _fetch_giveaways(
+        self,
+        custom_id: Optional[str] = None,
+        include_ended: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        # Read active giveaways (all, or just custom_id), rebuilding entries from a single query over giveaway_entries
+        conditions = [] if include_ended else ["g.is_ended = 0"]
+        if custom_id:
+            conditions.append("g.custom_id = ?")
+        where = " AND ".join(conditions) or "1"
+        params = (custom_id,) if custom_id else ()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
                 async with db.execute(
-                    "SELECT * FROM giveaways WHERE is_ended = 0"
+                    f"SELECT * FROM giveaways g WHERE {where}", params
                 ) as cursor:
                     rows = await cursor.fetchall()
-                    return [
-                        {
-                            "custom_id": row["custom_id"],
-                            "prize": row["prize"],
-                            "end_time": datetime.fromisoformat(row["end_time"]),
-                            "channel_id": row["channel_id"],
-                            "message_id": row["message_id"],
-                            "entries": set(json.loads(row["entries"])),
-                            "is_ended": bool(row["is_ended"])
-                        }
-                        for row in rows
-                    ]
+                async with db.execute(f"""
+                    SELECT e.giveaway_id, e.user_id, e.weight
+                    FROM giveaway_entries e
+                    JOIN giveaways g ON g.custom_id = e.giveaway_id
+                    WHERE {where}
+                """, params) as cursor:
+                    entry_rows = await cursor.fetchall()
+            
+            # giveaway_id -> {user_id: weight}
+            entries: Dict[str, Dict[int, int]] = {}
+            for entry in entry_rows:
+                entries.setdefault(entry["giveaway_id"], {})[entry["user_id"]] = entry["weight"]
+            
+            return [
+                {
+                    "custom_id": row["custom_id"],
+                    "prize": row["prize"],
+                    "end_time": datetime.fromisoformat(row["end_time"]),
+                    "channel_id": row["channel_id"],
+                    "message_id": row["message_id"],
+                    "guild_id": row["guild_id"],
+                    "entries": entries.get(row["custom_id"], {}),
+                    "is_ended": bool(row["is_ended"]),
+                    "winner_count": row["winner_count"],
+                    "role_weights": {int(role_id): weight for role_id, weight in json.loads(row["role_weights"]).items()},
+                    "winners": json.loads(row["winners"]),
+                    "requirements": json.loads(row["requirements"])
+                }
+                for row in rows
+            ]
         except Exception as e:
             logger.error(f"Failed to load giveaways: {e}")
-            return []
+            return None
     
     async def delete_giveaway(self, custom_id: str):
-        # Delete a giveaway from the database
+        # Queue deletion of a giveaway and its entries
+        self._enqueue(("giveaway", custom_id), [
+            ("DELETE FROM giveaway_entries WHERE giveaway_id = ?", (custom_id,)),
+            ("DELETE FROM giveaways WHERE custom_id = ?", (custom_id,)),
+        ])
+        
+        if self._giveaway_cache is not None:
+            self._giveaway_cache.pop(custom_id, None)
+    
+    async def load_giveaway_messages(self) -> List[Tuple[str, int, int]]:
+        # (custom_id, channel_id, message_id) of every stored giveaway, active or ended
+        return await self._load_locations("giveaways")
+    
+    async def _load_locations(self, table: str) -> List[Tuple[str, int, int]]:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("DELETE FROM giveaways WHERE custom_id = ?", (custom_id,))
-                await db.commit()
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute(f"SELECT custom_id, channel_id, message_id FROM {table}") as cursor:
+                    rows = await cursor.fetchall()
+            return [(row["custom_id"], row["channel_id"], row["message_id"]) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to delete giveaway {custom_id}: {e}")
+            logger.error(f"Failed to load {table} message locations: {e}")
+            return []
+    
+    # === GIVEAWAY HISTORY ===
+    
+    async def archive_giveaway(
+        self,
+        custom_id: str,
+        guild_id: Optional[int],
+        channel_id: int,
+        message_id: int,
+        prize: str,
+        winners: List[int],
+        entry_count: int,
+        end_time: datetime,
+        ended_at: Optional[datetime] = None
+    ):
+        # Queue an upsert of an ended giveaway's results (rerolls update the winners)
+        self._enqueue(("giveaway_history", custom_id), [("""
+            INSERT INTO giveaway_history
+            (giveaway_id, guild_id, channel_id, message_id, prize, winners, entry_count,
+             started_at, end_time, ended_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, (SELECT created_at FROM giveaways WHERE custom_id = ?), ?, ?)
+            ON CONFLICT(giveaway_id) DO UPDATE SET
+                winners = excluded.winners,
+                entry_count = excluded.entry_count
+        """, (
+            custom_id,
+            guild_id,
+            channel_id,
+            message_id,
+            prize,
+            json.dumps(winners),
+            entry_count,
+            custom_id,
+            end_time.isoformat(),
+            (ended_at or datetime.utcnow()).isoformat()
+        ))])
+    
+    async def load_giveaway_history(
+        self,
+        guild_id: int,
+        before: Optional[Tuple[str, str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        # One page of a guild's giveaway history, newest first. before is the (ended_at, giveaway_id)
+        # cursor of the last row of the previous page (keyset pagination: cost is independent of page depth)
+        try:
+            await self.flush()
+            db = await self._connection()
+            query = "SELECT * FROM giveaway_history WHERE guild_id = ?"
+            params: tuple = (guild_id,)
+            if before:
+                query += " AND (ended_at, giveaway_id) < (?, ?)"
+                params += tuple(before)
+            query += " ORDER BY ended_at DESC, giveaway_id DESC LIMIT ?"
+            params += (limit,)
+            
+            async with self._lock:
+                async with db.execute(query, params) as cursor:
+                    rows = await cursor.fetchall()
+            return [
+                {
+                    "giveaway_id": row["giveaway_id"],
+                    "channel_id": row["channel_id"],
+                    "message_id": row["message_id"],
+                    "prize": row["prize"],
+                    "winners": json.loads(row["winners"]),
+                    "entry_count": row["entry_count"],
+                    "started_at": datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
+                    "end_time": datetime.fromisoformat(row["end_time"]),
+                    "ended_at": row["ended_at"],
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"Failed to load giveaway history for guild {guild_id}: {e}")
+            return []
     
     # === ROSTER OPERATIONS ===
     
@@ -142,79 +715,264 @@ class Database:
         description: str,
         channel_id: int,
         message_id: int,
-        participants: Dict[int, tuple[str, str]],
         roster_limit: Optional[int] = None,
-        thumbnail: Optional[str] = None
+        thumbnail: Optional[str] = None,
+        guild_id: Optional[int] = None
     ):
-        # Save or update a roster
+        # Queue an upsert of roster metadata (participants live in roster_participants and are left untouched)
+        self._enqueue(("roster", custom_id), [("""
+            INSERT INTO rosters
+            (custom_id, title, date_time, description, roster_limit, thumbnail,
+             channel_id, message_id, participants, guild_id, created_at, last_active_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, '{}', ?, ?, ?)
+            ON CONFLICT(custom_id) DO UPDATE SET
+                title = excluded.title,
+                date_time = excluded.date_time,
+                description = excluded.description,
+                roster_limit = excluded.roster_limit,
+                thumbnail = excluded.thumbnail,
+                channel_id = excluded.channel_id,
+                message_id = excluded.message_id,
+                guild_id = COALESCE(excluded.guild_id, rosters.guild_id)
+        """, (
+            custom_id,
+            title,
+            date_time,
+            description,
+            roster_limit,
+            thumbnail,
+            channel_id,
+            message_id,
+            guild_id,
+            datetime.utcnow().isoformat(),
+            datetime.utcnow().isoformat()
+        ))])
+    
+    def _touch_roster(self, custom_id: str):
+        # Queue a last-activity bump (coalesced per roster, so a burst of joins is one UPDATE)
+        self._enqueue(("roster_active", custom_id), [(
+            "UPDATE rosters SET last_active_at = ? WHERE custom_id = ?",
+            (datetime.utcnow().isoformat(), custom_id)
+        )])
+    
+    async def save_roster_participant(self, custom_id: str, user_id: int, username: str, skill_level: str):
+        # Queue an add/update of a single participant
+        self._enqueue(("roster_participant", custom_id, user_id), [("""
+            INSERT INTO roster_participants
+            (roster_id, user_id, username, skill_level, joined_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(roster_id, user_id) DO UPDATE SET
+                username = excluded.username,
+                skill_level = excluded.skill_level
+        """, (custom_id, user_id, username, skill_level, datetime.utcnow().isoformat()))])
+        self._touch_roster(custom_id)
+    
+    async def delete_roster_participant(self, custom_id: str, user_id: int):
+        # Queue removal of a single participant
+        self._enqueue(("roster_participant", custom_id, user_id), [(
+            "DELETE FROM roster_participants WHERE roster_id = ? AND user_id = ?",
+            (custom_id, user_id)
+        )])
+        self._touch_roster(custom_id)
+    
+    async def load_rosters(self, active_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        # Load rosters, optionally only those with activity since active_since
+        return await self._fetch_rosters(active_since=active_since) or []
+    
+    async def load_roster(self, custom_id: str) -> Optional[Dict[str, Any]]:
+        # Load a single roster (e.g. to bring an evicted roster back into memory)
+        rows = await self._fetch_rosters(custom_id=custom_id)
+        return rows[0] if rows else None
+    
+    async def load_roster_by_message(self, message_id: int) -> Optional[Dict[str, Any]]:
+        # Load the roster posted as message_id (indexed by idx_rosters_message)
+        rows = await self._fetch_rosters(message_id=message_id)
+        return rows[0] if rows else None
+    
+    async def load_roster_messages(self) -> List[Tuple[str, int, int]]:
+        # (custom_id, channel_id, message_id) of every stored roster, resident in memory or not
+        return await self._load_locations("rosters")
+    
+    async def load_roster_channels_without_guild(self) -> List[int]:
+        # Channels of rosters saved before guild_id was stored (guild_id is NULL)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Convert participants dict to JSON-serializable format
-                participants_data = {
-                    str(user_id): {"username": username, "skill_level": skill}
-                    for user_id, (username, skill) in participants.items()
-                }
-                
-                await db.execute("""
-                    INSERT OR REPLACE INTO rosters 
-                    (custom_id, title, date_time, description, roster_limit, thumbnail,
-                     channel_id, message_id, participants)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    custom_id,
-                    title,
-                    date_time,
-                    description,
-                    roster_limit,
-                    thumbnail,
-                    channel_id,
-                    message_id,
-                    json.dumps(participants_data)
-                ))
-                await db.commit()
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute(
+                    "SELECT DISTINCT channel_id FROM rosters WHERE guild_id IS NULL"
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            return [row["channel_id"] for row in rows]
         except Exception as e:
-            logger.error(f"Failed to save roster {custom_id}: {e}")
+            logger.error(f"Failed to load rosters without a guild: {e}")
+            return []
+    
+    async def backfill_roster_guilds(self, channel_guilds: Dict[int, int]):
+        # Queue setting guild_id on rosters that have none, from their channel's guild (uses idx_rosters_channel)
+        for channel_id, guild_id in channel_guilds.items():
+            self._enqueue(("roster_guild", channel_id), [(
+                "UPDATE rosters SET guild_id = ? WHERE channel_id = ? AND guild_id IS NULL",
+                (guild_id, channel_id)
+            )])
     
-    async def load_rosters(self) -> List[Dict[str, Any]]:
-        # Load all active rosters
+    async def count_rosters(self) -> int:
+        # Number of stored rosters
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute("SELECT * FROM rosters") as cursor:
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute("SELECT COUNT(*) FROM rosters") as cursor:
+                    return (await cursor.fetchone())[0]
+        except Exception as e:
+            logger.error(f"Failed to count rosters: {e}")
+            return 0
+    
+    async def load_user_rosters(self, user_id: int, guild_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        # Rosters a member is on (newest first) with their skill level. INDEXED BY pins the plan to the member's
+        # rows: with a guild filter SQLite would otherwise drive the join from idx_rosters_guild and probe every
+        # roster of the guild.
+        try:
+            query = """
+                SELECT r.custom_id, r.title, r.date_time, r.channel_id, r.message_id, r.guild_id, p.skill_level
+                FROM roster_participants p INDEXED BY idx_roster_participants_user
+                JOIN rosters r ON r.custom_id = p.roster_id
+                WHERE p.user_id = ?
+            """
+            params: tuple = (user_id,)
+            if guild_id is not None:
+                query += " AND r.guild_id = ?"
+                params += (guild_id,)
+            query += " ORDER BY r.created_at DESC"
+            
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute(query, params) as cursor:
                     rows = await cursor.fetchall()
-                    result = []
-                    for row in rows:
-                        # Convert participants back to dict format
-                        participants_data = json.loads(row["participants"])
-                        participants = {
-                            int(user_id): (data["username"], data["skill_level"])
-                            for user_id, data in participants_data.items()
-                        }
-                        
-                        result.append({
-                            "custom_id": row["custom_id"],
-                            "title": row["title"],
-                            "date_time": row["date_time"],
-                            "description": row["description"],
-                            "roster_limit": row["roster_limit"],
-                            "thumbnail": row["thumbnail"],
-                            "channel_id": row["channel_id"],
-                            "message_id": row["message_id"],
-                            "participants": participants
-                        })
-                    return result
+            return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to load rosters: {e}")
+            logger.error(f"Failed to load rosters for user {user_id}: {e}")
             return []
     
+    async def _fetch_rosters(
+        self,
+        custom_id: Optional[str] = None,
+        message_id: Optional[int] = None,
+        active_since: Optional[datetime] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        # Read rosters (all, or filtered), hydrating participants in join order
+        try:
+            query = "SELECT * FROM rosters"
+            conditions: List[str] = []
+            params: tuple = ()
+            if custom_id is not None:
+                conditions.append("custom_id = ?")
+                params += (custom_id,)
+            if message_id is not None:
+                conditions.append("message_id = ?")
+                params += (message_id,)
+            if active_since is not None:
+                conditions.append("last_active_at >= ?")
+                params += (active_since.isoformat(),)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute(query, params) as cursor:
+                    rows = await cursor.fetchall()
+                if conditions:
+                    # Only the participants of the selected rosters (roster_participants PK lookup)
+                    participant_query = f"""
+                        SELECT roster_id, user_id, username, skill_level
+                        FROM roster_participants
+                        WHERE roster_id IN (SELECT custom_id FROM rosters WHERE {" AND ".join(conditions)})
+                        ORDER BY joined_at, rowid
+                    """
+                    participant_params = params
+                else:
+                    participant_query = """
+                        SELECT roster_id, user_id, username, skill_level
+                        FROM roster_participants
+                        ORDER BY joined_at, rowid
+                    """
+                    participant_params = ()
+                async with db.execute(participant_query, participant_params) as cursor:
+                    participant_rows = await cursor.fetchall()
+            
+            participants: Dict[str, Dict[int, tuple[str, str]]] = {}
+            for p in participant_rows:
+                participants.setdefault(p["roster_id"], {})[p["user_id"]] = (p["username"], p["skill_level"])
+            
+            return [
+                {
+                    "custom_id": row["custom_id"],
+                    "title": row["title"],
+                    "date_time": row["date_time"],
+                    "description": row["description"],
+                    "roster_limit": row["roster_limit"],
+                    "thumbnail": row["thumbnail"],
+                    "channel_id": row["channel_id"],
+                    "message_id": row["message_id"],
+                    "guild_id": row["guild_id"],
+                    "participants": participants.get(row["custom_id"], {})
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"Failed to load rosters: {e}")
+            return None
+    
     async def delete_roster(self, custom_id: str):
-        # Delete a roster from the database
+        # Queue deletion of a roster and its participants
+        self._enqueue(("roster", custom_id), [
+            ("DELETE FROM roster_participants WHERE roster_id = ?", (custom_id,)),
+            ("DELETE FROM rosters WHERE custom_id = ?", (custom_id,)),
+        ])
+    
+    # === CALENDAR REMINDERS ===
+    # event_start is stored as UTC ISO text, so range queries on idx_calendar_reminders_start compare correctly
+    
+    async def save_calendar_reminder(self, reminder_key: str, event_start: datetime):
+        # Queue a record of a posted reminder (the first post of a key wins)
+        self._enqueue(("calendar_reminder", reminder_key), [(
+            "INSERT OR IGNORE INTO calendar_reminders (reminder_key, event_start, posted_at) VALUES (?, ?, ?)",
+            (reminder_key, event_start.astimezone(timezone.utc).isoformat(), datetime.utcnow().isoformat())
+        )])
+    
+    async def load_calendar_reminders(self, since: datetime) -> Dict[str, datetime]:
+        # Reminder key -> event start of reminders posted for events starting at or after since
+        try:
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                async with db.execute(
+                    "SELECT reminder_key, event_start FROM calendar_reminders WHERE event_start >= ?",
+                    (since.astimezone(timezone.utc).isoformat(),)
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            return {row["reminder_key"]: datetime.fromisoformat(row["event_start"]) for row in rows}
+        except Exception as e:
+            logger.error(f"Failed to load calendar reminders: {e}")
+            return {}
+    
+    async def prune_calendar_reminders(self, before: datetime) -> int:
+        # Delete reminders of events that started before the given time; returns the number deleted
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("DELETE FROM rosters WHERE custom_id = ?", (custom_id,))
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                cursor = await db.execute(
+                    "DELETE FROM calendar_reminders WHERE event_start < ?",
+                    (before.astimezone(timezone.utc).isoformat(),)
+                )
                 await db.commit()
+                return cursor.rowcount
         except Exception as e:
-            logger.error(f"Failed to delete roster {custom_id}: {e}")
+            logger.error(f"Failed to prune calendar reminders: {e}")
+            return 0
     
     # === CLEANUP OPERATIONS ===
     
@@ -224,23 +982,39 @@ class Database:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
             cutoff_str = cutoff_date.isoformat()
             
-            async with aiosqlite.connect(self.db_path) as db:
-                # Delete old ended giveaways
+            await self.flush()
+            db = await self._connection()
+            async with self._lock:
+                # Delete old ended giveaways (entries first, while the parent rows still exist)
+                await db.execute("""
+                    DELETE FROM giveaway_entries WHERE giveaway_id IN (
+                        SELECT custom_id FROM giveaways WHERE is_ended = 1 AND end_time < ?
+                    )
+                """, (cutoff_str,))
                 cursor = await db.execute(
                     "DELETE FROM giveaways WHERE is_ended = 1 AND end_time < ?",
                     (cutoff_str,)
                 )
                 giveaways_deleted = cursor.rowcount
                 
-                # Note: Rosters don't have timestamps, so we skip them
-                # Admins can manually delete old rosters with /roster_delete
+                # Apply the same retention to the results archive
+                cursor = await db.execute(
+                    "DELETE FROM giveaway_history WHERE ended_at < ?",
+                    (cutoff_str,)
+                )
+                history_deleted = cursor.rowcount
+                
+                # Rosters aren't aged out: they're removed with their message or channel, or with /roster_delete
+                # (idle rosters only leave memory, see RosterCog.roster_eviction_task)
                 
                 await db.commit()
                 
                 if giveaways_deleted > 0:
                     logger.info(f"Cleaned up {giveaways_deleted} old giveaway(s) from database")
+                if history_deleted > 0:
+                    logger.info(f"Cleaned up {history_deleted} old giveaway history record(s)")
                 
-                return giveaways_deleted
+                return giveaways_deleted + history_deleted
         except Exception as e:
             logger.error(f"Failed to cleanup old entries: {e}")
             return 0
@@ -0,0 +1,107 @@
+# Weighted entry pool for giveaway draws
+# Entrants are bucketed by weight, so membership is O(1) and drawing k winners without replacement costs
+# O((k + rejected) * distinct weights), without copying or scanning the entrant list
+import logging
+import random
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger("bot.draw")
+
+# Entrants failing accept that one draw discards before giving up (bounds a draw when most have left)
+MAX_REJECTIONS = 10_000
+
+
+class EntryPool:
+    def __init__(self):
+        self._weights: Dict[int, int] = {}
+        self._buckets: Dict[int, List[int]] = {}
+
+    @classmethod
+    def from_weights(cls, weights: Dict[int, int]) -> "EntryPool":
+        pool = cls()
+        for user_id, weight in weights.items():
+            pool.add(user_id, weight)
+        return pool
+
+    def add(self, user_id: int, weight: int = 1) -> bool:
+        # Add an entrant; returns False if they were already entered
+        if user_id in self._weights:
+            return False
+        weight = max(1, int(weight))
+        self._weights[user_id] = weight
+        self._buckets.setdefault(weight, []).append(user_id)
+        return True
+
+    def weight_of(self, user_id: int) -> int:
+        return self._weights.get(user_id, 0)
+
+    def weights(self) -> Dict[int, int]:
+        return dict(self._weights)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._weights
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._weights)
+
+    def draw(
+        self,
+        k: int,
+        accept: Optional[Callable[[int], bool]] = None,
+        exclude: Optional[Set[int]] = None,
+        rng: Optional[random.Random] = None,
+        max_rejections: int = MAX_REJECTIONS
+    ) -> List[int]:
+        # Draw up to k distinct winners with probability proportional to weight.
+        # Entrants in exclude (e.g. previous winners) are never drawn; entrants failing accept
+        # (e.g. left the server) are discarded and another is drawn in their place, up to max_rejections.
+        rng = rng or random
+        exclude = exclude or set()
+        # Per-draw sparse Fisher-Yates state per bucket: positions below remaining[weight] are still undrawn,
+        # and swaps[weight] maps a position to the entrant moved there. Buckets are never copied or scanned,
+        # so each pick is O(distinct weights) however many entrants were discarded before it.
+        remaining = {weight: len(bucket) for weight, bucket in self._buckets.items()}
+        swaps: Dict[int, Dict[int, int]] = {weight: {} for weight in self._buckets}
+
+        winners: List[int] = []
+        rejections = 0
+        while len(winners) < k:
+            # Pick a bucket proportional to weight * entrants still undrawn in it
+            total = sum(weight * count for weight, count in remaining.items())
+            if total <= 0:
+                break
+            target = rng.random() * total
+            chosen = 0
+            for weight, count in remaining.items():
+                if count <= 0:
+                    continue
+                chosen = weight
+                target -= weight * count
+                if target < 0:
+                    break
+            weight = chosen
+
+            user_id = self._take(self._buckets[weight], swaps[weight], remaining[weight], rng)
+            remaining[weight] -= 1
+            if user_id in exclude:
+                continue
+            if accept is not None and not accept(user_id):
+                rejections += 1
+                if rejections >= max_rejections:
+                    logger.warning(f"Draw stopped after {rejections} rejected entrants ({len(winners)}/{k} winners)")
+                    break
+                continue
+            winners.append(user_id)
+        return winners
+
+    @staticmethod
+    def _take(bucket: List[int], swaps: Dict[int, int], remaining: int, rng) -> int:
+        # Uniform pick among positions [0, remaining); the last undrawn entrant moves into the picked position
+        index = rng.randrange(remaining)
+        last = remaining - 1
+        user_id = swaps.get(index, bucket[index])
+        swaps[index] = swaps.pop(last, bucket[last])
+        return user_id
@@ -0,0 +1,304 @@
+# Bot-wide outbound message scheduler: every message edit/fetch/reply from the cogs goes through here
+# Each channel has its own queue and token bucket (Discord rate-limits message routes per channel), so a hot
+# roster only delays its own channel. Pending edits to the same message coalesce into one (the newest wins),
+# interaction-driven work jumps ahead of background work, and 429s pause the channel for Retry-After.
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
+
+import discord
+
+from .coalescer import retry_after
+
+logger = logging.getLogger("bot.edits")
+
+# Per-channel bucket: Discord allows roughly 5 message edits per 5 seconds per channel
+CHANNEL_RATE = 1.0
+CHANNEL_BURST = 5
+
+# Bot-wide bucket, kept under the global limit of 50 requests/second
+GLOBAL_RATE = 45.0
+GLOBAL_BURST = 45
+
+# Times one job is retried after being rate limited before its callers see the error
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class EditPriority(IntEnum):
+    # Lower runs first
+    INTERACTION = 0  # a user is waiting on this (a click, a command, a giveaway result)
+    BACKGROUND = 1   # maintenance (restores, migrations, periodic refreshes)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = float(capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        # Seconds until a token is available (0 if one is available now)
+        now = self.clock()
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def pause(self, seconds: float):
+        # Rate limited by Discord: empty the bucket and block it for the given time
+        self.tokens = 0.0
+        self._blocked_until = max(self._blocked_until, self.clock() + seconds)
+
+    @property
+    def full(self) -> bool:
+        self._refill(self.clock())
+        return self.tokens >= self.capacity and self.clock() >= self._blocked_until
+
+
+class _Job:
+    __slots__ = ("key", "send", "priority", "futures", "attempts", "fields")
+
+    def __init__(self, key: Hashable, send: Callable[[], Awaitable[Any]], priority: EditPriority):
+        self.key = key
+        self.send = send
+        self.priority = priority
+        self.futures: List[asyncio.Future] = []
+        self.attempts = 0
+        # Pending message.edit() fields, so coalesced edits of different fields merge
+        self.fields: Optional[Dict[str, Any]] = None
+
+
+class _ChannelQueue:
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        # One ordered queue per priority; keys are unique across them
+        self.queues: Dict[EditPriority, "OrderedDict[Hashable, _Job]"] = {
+            priority: OrderedDict() for priority in EditPriority
+        }
+        self.task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def find(self, key: Hashable) -> Optional[_Job]:
+        for queue in self.queues.values():
+            job = queue.get(key)
+            if job is not None:
+                return job
+        return None
+
+    def pop_next(self) -> Optional[_Job]:
+        for priority in EditPriority:
+            queue = self.queues[priority]
+            if queue:
+                return queue.popitem(last=False)[1]
+        return None
+
+
+def _consume(future: asyncio.Future):
+    # Fire-and-forget callers never await their future; retrieve the exception so asyncio doesn't warn
+    if not future.cancelled():
+        future.exception()
+
+
+class EditScheduler:
+    def __init__(
+        self,
+        channel_rate: float = CHANNEL_RATE,
+        channel_burst: int = CHANNEL_BURST,
+        global_rate: float = GLOBAL_RATE,
+        global_burst: int = GLOBAL_BURST
+    ):
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self._channels: Dict[int, _ChannelQueue] = {}
+        self._unique = itertools.count()
+        self._closed = False
+
+        # Metrics: jobs submitted, folded into a pending job, actually sent, rate-limit backoffs, failures
+        self.submitted = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.rate_limited = 0
+        self.failed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(channel) for channel in self._channels.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "sent": self.sent,
+            "rate_limited": self.rate_limited,
+            "failed": self.failed,
+            "queued": self.queue_depth,
+            "channels": len(self._channels),
+        }
+
+    def submit(
+        self,
+        channel_id: int,
+        send: Callable[[], Awaitable[Any]],
+        key: Optional[Hashable] = None,
+        priority: EditPriority = EditPriority.BACKGROUND
+    ) -> asyncio.Future:
+        # Queue send() on channel_id's queue. A job with the same key that hasn't started yet is replaced
+        # (its callers get this job's result); key=None never coalesces. The returned future resolves with
+        # send()'s result or exception and may be awaited or ignored.
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume)
+        if self._closed:
+            future.cancel()
+            return future
+
+        self.submitted += 1
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = _ChannelQueue(TokenBucket(self.channel_rate, self.channel_burst))
+            self._channels[channel_id] = channel
+
+        if key is None:
+            key = ("unique", next(self._unique))
+        job = channel.find(key)
+        if job is not None:
+            self.coalesced += 1
+            job.send = send
+            if priority < job.priority:
+                # Promote: move the job into the higher-priority queue
+                del channel.queues[job.priority][key]
+                job.priority = priority
+                channel.queues[priority][key] = job
+        else:
+            job = _Job(key, send, priority)
+            channel.queues[priority][key] = job
+        job.futures.append(future)
+
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._drain(channel_id, channel))
+        return future
+
+    def edit(
+        self,
+        message: Union[discord.Message, discord.PartialMessage],
+        priority: EditPriority = EditPriority.BACKGROUND,
+        **fields: Any
+    ) -> asyncio.Future:
+        # Coalesced edit of a (partial) message; pending edits merge, newer values winning per field
+        channel_id = message.channel.id
+        key = ("edit", message.id)
+        channel = self._channels.get(channel_id)
+        pending = channel.find(key) if channel else None
+        if pending is not None and pending.fields:
+            fields = {**pending.fields, **fields}
+        future = self.submit(channel_id, lambda: message.edit(**fields), key=key, priority=priority)
+        job = self._channels[channel_id].find(key) if channel_id in self._channels else None
+        if job is not None:
+            job.fields = fields
+        return future
+
+    def fetch(
+        self,
+        message: discord.PartialMessage,
+        priority: EditPriority = EditPriority.BACKGROUND
+    ) -> asyncio.Future:
+        # Fetch a full message; concurrent fetches of the same message share one request
+        return self.submit(
+            message.channel.id,
+            message.fetch,
+            key=("fetch", message.id),
+            priority=priority,
+        )
+
+    async def close(self):
+        # Stop all channel workers; anything still queued is cancelled
+        self._closed = True
+        for channel in self._channels.values():
+            if channel.task:
+                channel.task.cancel()
+            for queue in channel.queues.values():
+                for job in queue.values():
+                    for future in job.futures:
+                        future.cancel()
+                queue.clear()
+        tasks = [channel.task for channel in self._channels.values() if channel.task]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._channels.clear()
+        logger.info(f"Edit scheduler stopped: {self.stats()}")
+
+    async def _acquire(self, bucket: TokenBucket):
+        # Wait for a token from both the channel's bucket and the bot-wide bucket
+        while True:
+            delay = max(bucket.delay(), self.global_bucket.delay())
+            if delay <= 0:
+                bucket.take()
+                self.global_bucket.take()
+                return
+            await asyncio.sleep(delay)
+
+    async def _drain(self, channel_id: int, channel: _ChannelQueue):
+        try:
+            while len(channel):
+                # Wait for a token before taking the next job: until then, queued jobs keep coalescing and
+                # a higher-priority job submitted meanwhile is still picked first
+                await self._acquire(channel.bucket)
+                job = channel.pop_next()
+                if job is None:
+                    break
+                job.attempts += 1
+                try:
+                    result = await job.send()
+                except asyncio.CancelledError:
+                    for future in job.futures:
+                        future.cancel()
+                    raise
+                except Exception as e:
+                    backoff = retry_after(e)
+                    if backoff is not None and job.attempts <= MAX_RATE_LIMIT_RETRIES:
+                        self.rate_limited += 1
+                        logger.warning(f"Rate limited in channel {channel_id}, pausing {backoff:.2f}s")
+                        channel.bucket.pause(backoff)
+                        self._requeue(channel, job)
+                        continue
+                    self.failed += 1
+                    for future in job.futures:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                self.sent += 1
+                for future in job.futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # Forget the channel once idle with a refilled bucket (a partly used bucket keeps its state)
+            if not len(channel) and channel.bucket.full and self._channels.get(channel_id) is channel:
+                del self._channels[channel_id]
+
+    @staticmethod
+    def _requeue(channel: _ChannelQueue, job: _Job):
+        # Put a rate-limited job back at the front; if it was re-submitted meanwhile, the newer one wins
+        newer = channel.find(job.key)
+        if newer is not None:
+            newer.futures.extend(job.futures)
+            return
+        queue = channel.queues[job.priority]
+        queue[job.key] = job
+        queue.move_to_end(job.key, last=False)
@@ -0,0 +1,206 @@
+# Streaming ICS (RFC 5545) event parser
+# Text arrives in chunks (e.g. straight from the HTTP response); lines are unfolded on the fly and each VEVENT
+# is yielded as soon as its END:VEVENT is seen, so memory is bounded by one event rather than the whole feed
+import logging
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("bot.ics")
+
+# Simple text properties copied onto the event record
+TEXT_PROPERTIES = {
+    "SUMMARY": "summary",
+    "UID": "uid",
+    "LOCATION": "location",
+    "DESCRIPTION": "description",
+    "URL": "url",
+}
+
+# Properties read for recurrence expansion (see utils/recurrence.py)
+RECURRENCE_PROPERTIES = {"RRULE", "RDATE", "EXDATE", "RECURRENCE-ID"}
+
+
+def _parse_basic_datetime(value: str) -> datetime:
+    # YYYYMMDDTHHMMSS by slicing (several times faster than strptime, which dominated parsing large feeds)
+    if len(value) != 15 or value[8] != "T" or not (value[:8] + value[9:]).isdigit():
+        raise ValueError(f"invalid ICS date-time: {value!r}")
+    return datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15])
+    )
+
+
+def parse_ics_local_datetime(value: str, tzid: Optional[str]) -> datetime:
+    # Aware datetime in the value's own zone (UTC for a Z suffix or no TZID); recurrence rules expand in it
+    value = value.strip()
+    if value.endswith("Z"):
+        return _parse_basic_datetime(value[:-1]).replace(tzinfo=timezone.utc)
+    # Naive local time with TZID
+    dt = _parse_basic_datetime(value)
+    if tzid:
+        try:
+            tz = _zone(tzid)
+        except Exception:
+            tz = timezone.utc
+        return dt.replace(tzinfo=tz)
+    # Assume UTC if no TZID
+    return dt.replace(tzinfo=timezone.utc)
+
+
+def parse_ics_datetime(value: str, tzid: Optional[str]) -> datetime:
+    # Supports forms like 20250101T170000Z or 20250101T170000 with TZID; returns UTC
+    return parse_ics_local_datetime(value, tzid).astimezone(timezone.utc)
+
+
+def parse_ics_datetime_list(value: str, params: Dict[str, str]) -> List[datetime]:
+    # Comma-separated RDATE/EXDATE values in UTC; dates and periods contribute their (start) date-time
+    values: List[datetime] = []
+    for item in value.split(","):
+        item = item.split("/", 1)[0].strip()
+        if not item:
+            continue
+        if params.get("VALUE") == "DATE" or len(item) == 8:
+            item += "T000000"
+        values.append(parse_ics_datetime(item, params.get("TZID")))
+    return values
+
+
+@lru_cache(maxsize=64)
+def _zone(tzid: str) -> ZoneInfo:
+    return ZoneInfo(tzid)
+
+
+def _split_property(line: str) -> Optional[Tuple[str, Dict[str, str], str]]:
+    # NAME[;PARAM=VALUE...]:value -> (NAME, params, value)
+    left, sep, value = line.partition(":")
+    if not sep:
+        return None
+    name, *params = left.split(";")
+    return name.upper(), dict(param.partition("=")[::2] for param in params), value
+
+
+# NAME of a NAME[;params]:value line, matched without splitting the rest
+_property_name = re.compile(r"[^;:]*").match
+
+
+class IcsEventParser:
+    # Incremental parser: feed() text chunks and get back the events they complete; close() flushes the end.
+    # Only top-level VEVENT properties are read (nested components such as VALARM are skipped).
+    def __init__(self):
+        self._buffer = ""
+        self._line: Optional[str] = None
+        # Nesting inside the current VEVENT (0 = outside, 1 = in the event, >1 = in a nested component)
+        self._depth = 0
+        # Raw property lines of the current VEVENT, split only when the event is built
+        self._properties: List[str] = []
+
+        # Metrics: events yielded and blocks skipped (no usable start, all-day, or unparsable)
+        self.events = 0
+        self.skipped = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, object]]:
+        # Events completed by this chunk (a partial line is kept until the next chunk)
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        events: List[Dict[str, object]] = []
+        pending = self._line
+        for raw in lines:
+            # Join lines that start with a space or tab with the previous line
+            if raw[:1] in (" ", "\t"):
+                raw = raw[1:].rstrip("\r")
+                pending = raw if pending is None else pending + raw
+                continue
+            if pending is not None:
+                event = self._logical_line(pending)
+                if event is not None:
+                    events.append(event)
+            pending = raw.rstrip("\r")
+        self._line = pending
+        return events
+
+    def close(self) -> List[Dict[str, object]]:
+        events = self.feed("\n") if self._buffer else []
+        if self._line is not None:
+            event = self._logical_line(self._line)
+            self._line = None
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _logical_line(self, line: str) -> Optional[Dict[str, object]]:
+        line = line.strip()
+        if self._depth == 1 and not line.startswith(("BEGIN:", "END:")):
+            if line:
+                self._properties.append(line)
+            return None
+        if line.startswith("BEGIN:"):
+            if self._depth or line == "BEGIN:VEVENT":
+                self._depth += 1
+        elif line.startswith("END:") and self._depth:
+            self._depth -= 1
+            if self._depth == 0:
+                event = self._build_event()
+                self._properties = []
+                if event is None:
+                    self.skipped += 1
+                else:
+                    self.events += 1
+                return event
+        return None
+
+    def _build_event(self) -> Optional[Dict[str, object]]:
+        # Event record: the text properties, start (UTC), dtstart (in its own zone), the recurrence properties
+        # (rrule, rdate, exdate, recurrence_id) and signature, a hash of the event's content for caches
+        event: Dict[str, object] = {key: None for key in TEXT_PROPERTIES.values()}
+        start: Optional[datetime] = None
+        rrules: List[str] = []
+        rdates: List[datetime] = []
+        exdates: List[datetime] = []
+        recurrence_id: Optional[datetime] = None
+        for line in self._properties:
+            name = _property_name(line).group().upper()
+            key = TEXT_PROPERTIES.get(name)
+            if key is not None:
+                _, sep, value = line.partition(":")
+                if not sep:
+                    continue
+                value = value.strip()
+                if key == "description":
+                    value = value.replace("\\n", "\n")
+                event[key] = value
+            elif name in RECURRENCE_PROPERTIES or name == "DTSTART":
+                prop = _split_property(line)
+                if prop is None:
+                    continue
+                _, params, value = prop
+                # Skip all‑day events for reminders
+                if name == "DTSTART" and params.get("VALUE", "").endswith("DATE"):
+                    return None
+                try:
+                    if name == "DTSTART":
+                        start = parse_ics_local_datetime(value, params.get("TZID"))
+                    elif name == "RRULE":
+                        rrules.append(value.strip())
+                    elif name == "RDATE":
+                        rdates.extend(parse_ics_datetime_list(value, params))
+                    elif name == "EXDATE":
+                        exdates.extend(parse_ics_datetime_list(value, params))
+                    else:
+                        recurrence_id = parse_ics_datetime_list(value, params)[0]
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"Skip event parse error: {e}")
+                    return None
+        if start is None:
+            return None
+        event["summary"] = event["summary"] or "(No Title)"
+        event["start"] = start.astimezone(timezone.utc)
+        event["dtstart"] = start
+        event["rrule"] = rrules
+        event["rdate"] = rdates
+        event["exdate"] = exdates
+        event["recurrence_id"] = recurrence_id
+        event["signature"] = hash(tuple(self._properties))
+        return event
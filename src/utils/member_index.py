@@ -0,0 +1,61 @@
+# In-memory per-guild index of member roles and join dates
+# Seeded lazily from the gateway member cache (no REST) and kept current by member join/update/remove events,
+# so eligibility checks during an entry rush are plain dict/set lookups
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional
+
+import discord
+
+logger = logging.getLogger("bot.member_index")
+
+
+@dataclass(frozen=True)
+class MemberRecord:
+    role_ids: FrozenSet[int]
+    joined_at: Optional[datetime]
+
+
+class MemberIndex:
+    def __init__(self):
+        self._guilds: Dict[int, Dict[int, MemberRecord]] = {}
+
+    @staticmethod
+    def _record(member: discord.Member) -> MemberRecord:
+        return MemberRecord(
+            role_ids=frozenset(role.id for role in member.roles),
+            joined_at=member.joined_at,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "guilds": len(self._guilds),
+            "members": sum(len(members) for members in self._guilds.values()),
+        }
+
+    def ensure_guild(self, guild: discord.Guild) -> Dict[int, MemberRecord]:
+        # Build the guild's index from the member cache the first time it's needed
+        members = self._guilds.get(guild.id)
+        if members is None:
+            members = {member.id: self._record(member) for member in guild.members}
+            self._guilds[guild.id] = members
+            logger.info(f"Indexed {len(members)} member(s) for guild {guild.id}")
+        return members
+
+    def get(self, guild: discord.Guild, user_id: int) -> Optional[MemberRecord]:
+        return self.ensure_guild(guild).get(user_id)
+
+    def upsert(self, member: discord.Member):
+        # Called from member join/update events; guilds not yet indexed are built lazily later
+        members = self._guilds.get(member.guild.id)
+        if members is not None:
+            members[member.id] = self._record(member)
+
+    def remove(self, guild_id: int, user_id: int):
+        members = self._guilds.get(guild_id)
+        if members is not None:
+            members.pop(user_id, None)
+
+    def drop_guild(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
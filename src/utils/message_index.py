@@ -0,0 +1,53 @@
+# Locator index for objects posted as a Discord message (giveaways, rosters)
+# Maps message id and channel id to the object's id for every stored object, resident in memory or not,
+# so message/channel deletion events are matched with dict lookups instead of REST polling or DB queries
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+class MessageIndex:
+    def __init__(self):
+        self._by_message: Dict[int, str] = {}
+        self._by_channel: Dict[int, Set[str]] = {}
+        self._locations: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, int, int]]) -> "MessageIndex":
+        # Build from (custom_id, channel_id, message_id) rows
+        index = cls()
+        for custom_id, channel_id, message_id in rows:
+            index.add(custom_id, channel_id, message_id)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, custom_id: str) -> bool:
+        return custom_id in self._locations
+
+    def add(self, custom_id: str, channel_id: int, message_id: int):
+        self.remove(custom_id)
+        self._locations[custom_id] = (channel_id, message_id)
+        self._by_message[message_id] = custom_id
+        self._by_channel.setdefault(channel_id, set()).add(custom_id)
+
+    def remove(self, custom_id: str):
+        location = self._locations.pop(custom_id, None)
+        if location is None:
+            return
+        channel_id, message_id = location
+        if self._by_message.get(message_id) == custom_id:
+            del self._by_message[message_id]
+        in_channel = self._by_channel.get(channel_id)
+        if in_channel is not None:
+            in_channel.discard(custom_id)
+            if not in_channel:
+                del self._by_channel[channel_id]
+
+    def by_message(self, message_id: int) -> Optional[str]:
+        return self._by_message.get(message_id)
+
+    def by_messages(self, message_ids: Iterable[int]) -> Set[str]:
+        return {self._by_message[message_id] for message_id in message_ids if message_id in self._by_message}
+
+    def in_channel(self, channel_id: int) -> Set[str]:
+        return set(self._by_channel.get(channel_id, ()))
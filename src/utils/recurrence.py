@@ -0,0 +1,122 @@
+# Recurrence expansion for parsed calendar events (RRULE, RDATE, EXDATE, RECURRENCE-ID overrides)
+# Recurring events are expanded into concrete occurrences inside a bounded look-ahead window. Expansions are
+# memoized per (UID, content signature, window), so re-expanding an unchanged feed, or an unchanged event in a
+# changed feed, is a dict lookup; entries not used by the latest expansion are dropped.
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Hashable, List, Tuple
+
+from dateutil.rrule import rrulestr, rruleset
+
+logger = logging.getLogger("bot.recurrence")
+
+# Occurrences kept per event and window at most (caps the output only; walking up to the window is bounded by
+# skipping sub-daily rules and fast-forwarding DAILY/WEEKLY rules, see _rule_start)
+MAX_OCCURRENCES = 500
+
+# Rules that are skipped: walking them from an old DTSTART to the window takes seconds, and reminders for
+# something that repeats every hour or faster would be spam anyway
+SUB_DAILY_FREQUENCIES = {"SECONDLY", "MINUTELY", "HOURLY"}
+
+# Fixed period in days of the rules whose DTSTART can be moved forward by whole periods
+FIXED_PERIOD_DAYS = {"DAILY": 1, "WEEKLY": 7}
+
+Event = Dict[str, object]
+
+
+class RecurrenceExpander:
+    def __init__(self, max_occurrences: int = MAX_OCCURRENCES):
+        self.max_occurrences = max_occurrences
+        self._cache: Dict[Tuple[Hashable, ...], List[datetime]] = {}
+
+        # Metrics: expansions served from the cache vs. computed
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self._cache)}
+
+    def expand(self, events: List[Event], start: datetime, end: datetime) -> List[Event]:
+        # Concrete occurrences (start in UTC) of events in [start, end). Non-recurring events pass through
+        # unchanged whatever their start; a RECURRENCE-ID override replaces the occurrence it names.
+        overrides: Dict[Tuple[object, datetime], Event] = {}
+        occurrences: List[Event] = []
+        for event in events:
+            if event["recurrence_id"] is not None:
+                overrides[(event["uid"], event["recurrence_id"])] = event
+                occurrences.append(event)
+
+        used: Dict[Tuple[Hashable, ...], List[datetime]] = {}
+        for event in events:
+            if event["recurrence_id"] is not None:
+                continue
+            if not (event["rrule"] or event["rdate"]):
+                occurrences.append(event)
+                continue
+            key = (event["uid"], event["signature"], start, end)
+            starts = self._cache.get(key)
+            if starts is None:
+                self.misses += 1
+                starts = self._occurrences(event, start, end)
+            else:
+                self.hits += 1
+            used[key] = starts
+            for occurrence in starts:
+                if (event["uid"], occurrence) not in overrides:
+                    occurrences.append({**event, "start": occurrence})
+        self._cache = used
+        return occurrences
+
+    def _occurrences(self, event: Event, start: datetime, end: datetime) -> List[datetime]:
+        # Occurrence starts (UTC) in [start, end); rules expand in DTSTART's zone so wall-clock times survive DST
+        dtstart: datetime = event["dtstart"]  # type: ignore[assignment]
+        rules = rruleset()
+        # DTSTART is always the first occurrence, whether or not it matches the rule
+        rules.rdate(dtstart)
+        try:
+            for rule in event["rrule"]:  # type: ignore[attr-defined]
+                parts = _rule_parts(rule)
+                if parts.get("FREQ") in SUB_DAILY_FREQUENCIES:
+                    logger.warning(f"Ignoring sub-daily RRULE of event {event['uid']}: {rule}")
+                    continue
+                rules.rrule(rrulestr(rule, dtstart=_rule_start(dtstart, parts, start)))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring invalid RRULE of event {event['uid']}: {e}")
+        for rdate in event["rdate"]:  # type: ignore[attr-defined]
+            rules.rdate(rdate)
+        for exdate in event["exdate"]:  # type: ignore[attr-defined]
+            rules.exdate(exdate)
+
+        starts: List[datetime] = []
+        for occurrence in rules.xafter(start, count=self.max_occurrences, inc=True):
+            if occurrence >= end:
+                break
+            starts.append(occurrence.astimezone(timezone.utc))
+        return starts
+
+
+def _rule_parts(rule: str) -> Dict[str, str]:
+    # FREQ=WEEKLY;INTERVAL=2;BYDAY=TH -> {"FREQ": "WEEKLY", "INTERVAL": "2", "BYDAY": "TH"}
+    return {name.strip().upper(): value for name, _, value in (part.partition("=") for part in rule.split(";"))}
+
+
+def _rule_start(dtstart: datetime, parts: Dict[str, str], start: datetime) -> datetime:
+    # DTSTART moved forward by whole periods to within one period of the window, so expansion doesn't walk
+    # every occurrence since DTSTART. Only for fixed-period rules without COUNT (COUNT counts from DTSTART);
+    # the step is in wall-clock days, so the local time of day is kept across DST changes.
+    days = FIXED_PERIOD_DAYS.get(parts.get("FREQ", ""))
+    if days is None or "COUNT" in parts:
+        return dtstart
+    try:
+        period = days * max(1, int(parts.get("INTERVAL", 1)))
+    except ValueError:
+        return dtstart
+    periods = (start - dtstart).days // period - 1
+    if periods <= 0:
+        return dtstart
+    return dtstart + timedelta(days=periods * period)
+
+
+def window_start(now: datetime) -> datetime:
+    # Expansion windows start at UTC midnight, so every tick of a day shares one window (and its cache entries)
+    return now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
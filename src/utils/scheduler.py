@@ -0,0 +1,114 @@
+# Deadline scheduler: fires callbacks at absolute times using a min-heap of deadlines
+# Sleeps exactly until the earliest deadline (or indefinitely when nothing is pending)
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger("bot.scheduler")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DeadlineScheduler:
+    # Keys are scheduled at a UTC-aware datetime; when due, on_due(keys) receives every key due in that tick.
+    # Rescheduling/cancelling is O(log n) via lazy deletion: stale heap entries are skipped when popped.
+    def __init__(
+        self,
+        on_due: Callable[[List[Hashable]], Awaitable[None]],
+        name: str = "scheduler",
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        self.on_due = on_due
+        self.name = name
+        self.clock = clock
+        self._heap: List[Tuple[datetime, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, datetime] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics: how often the loop woke up and how many keys it fired
+        self.wakeups = 0
+        self.fired = 0
+
+    @property
+    def pending(self) -> int:
+        # Number of keys waiting for their deadline
+        return len(self._deadlines)
+
+    def next_deadline(self) -> Optional[datetime]:
+        # Earliest live deadline, discarding stale heap entries on the way
+        while self._heap:
+            when, _, key = self._heap[0]
+            if self._deadlines.get(key) == when:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def schedule(self, key: Hashable, when: datetime):
+        # Arm (or re-arm) key to fire at when
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        current_head = self.next_deadline()
+        self._deadlines[key] = when
+        heapq.heappush(self._heap, (when, next(self._seq), key))
+        if current_head is None or when < current_head:
+            self._wakeup.set()
+
+    def cancel(self, key: Hashable):
+        # Disarm key; its heap entry is dropped lazily
+        self._deadlines.pop(key, None)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _pop_due(self, now: datetime) -> List[Hashable]:
+        # Pop every live key whose deadline has passed
+        due: List[Hashable] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == when:
+                del self._deadlines[key]
+                due.append(key)
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            head = self.next_deadline()
+            if head is None:
+                # Idle: nothing pending, sleep until schedule() wakes us
+                await self._wakeup.wait()
+                self.wakeups += 1
+                continue
+
+            delay = (head - self.clock()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeups += 1
+                continue
+
+            due = self._pop_due(self.clock())
+            if not due:
+                continue
+            self.fired += len(due)
+            try:
+                await self.on_due(due)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{self.name}: callback failed for {len(due)} key(s): {e}", exc_info=True)
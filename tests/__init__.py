@@ -0,0 +1 @@
+# Unit tests (stdlib unittest): python -m unittest
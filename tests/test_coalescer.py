@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from src.utils.coalescer import UpdateCoalescer, retry_after
+
+WINDOW = 0.05
+
+
+class RateLimited(Exception):
+    # Shaped like discord.RateLimited
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limited for {retry_after}s")
+        self.retry_after = retry_after
+
+
+class HTTPError(Exception):
+    # Shaped like discord.HTTPException
+    def __init__(self, status: int, headers: dict):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.response = SimpleNamespace(headers=headers)
+
+
+class RetryAfterTest(unittest.TestCase):
+    def test_rate_limited_error(self):
+        self.assertEqual(retry_after(RateLimited(1.5)), 1.5)
+
+    def test_http_429_uses_the_retry_after_header(self):
+        self.assertEqual(retry_after(HTTPError(429, {"Retry-After": "2"})), 2.0)
+
+    def test_http_429_without_a_usable_header_backs_off_five_seconds(self):
+        self.assertEqual(retry_after(HTTPError(429, {})), 5.0)
+        self.assertEqual(retry_after(HTTPError(429, {"Retry-After": "soon"})), 5.0)
+
+    def test_other_errors_are_not_rate_limits(self):
+        self.assertIsNone(retry_after(HTTPError(500, {})))
+        self.assertIsNone(retry_after(ValueError("boom")))
+
+
+class UpdateCoalescerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.loop = asyncio.get_running_loop()
+        self.coalescer = UpdateCoalescer(WINDOW, name="test")
+        self.state = 0
+        # (time, state) of every update performed
+        self.updates = []
+
+    async def asyncTearDown(self):
+        self.coalescer.cancel_all()
+
+    async def update(self):
+        # Renders the current state when it runs, like the embed updates do
+        self.updates.append((self.loop.time(), self.state))
+
+    async def drain(self):
+        while self.coalescer.is_pending("key"):
+            await asyncio.sleep(WINDOW / 5)
+
+    async def test_burst_sends_the_first_update_and_one_trailing_update(self):
+        for _ in range(20):
+            self.state += 1
+            self.coalescer.request("key", self.update)
+            await asyncio.sleep(0)
+        await self.drain()
+
+        self.assertEqual(self.coalescer.requested, 20)
+        self.assertEqual(self.coalescer.sent, 2)
+        self.assertEqual(self.updates[-1][1], 20)
+
+    async def test_bursts_send_at_most_one_update_per_window(self):
+        for _ in range(6):
+            for _ in range(5):
+                self.state += 1
+                self.coalescer.request("key", self.update)
+            await asyncio.sleep(WINDOW / 3)
+        await self.drain()
+
+        times = [when for when, _ in self.updates]
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        self.assertTrue(all(gap >= WINDOW * 0.9 for gap in gaps), gaps)
+        self.assertLess(self.coalescer.sent, 30)
+        # The trailing update carries the final state
+        self.assertEqual(self.updates[-1][1], self.state)
+
+    async def test_keys_are_coalesced_independently(self):
+        self.coalescer.request("key", self.update)
+        self.coalescer.request("other", self.update)
+        await asyncio.sleep(WINDOW / 5)
+        self.assertEqual(self.coalescer.sent, 2)
+
+    async def test_rate_limit_backs_off_for_retry_after_and_resends(self):
+        backoff = WINDOW * 3
+        calls = []
+
+        async def update():
+            calls.append(self.loop.time())
+            if len(calls) == 1:
+                raise RateLimited(backoff)
+            await self.update()
+
+        with self.assertLogs("bot.coalescer", "WARNING"):
+            self.coalescer.request("key", update)
+            await self.drain()
+
+        self.assertEqual(len(calls), 2)
+        self.assertGreaterEqual(calls[1] - calls[0], backoff * 0.9)
+        self.assertEqual(self.coalescer.rate_limited, 1)
+        self.assertEqual(self.coalescer.sent, 1)
+
+    async def test_cancel_drops_the_trailing_update(self):
+        self.coalescer.request("key", self.update)
+        self.coalescer.request("key", self.update)
+        await asyncio.sleep(0)
+        self.coalescer.cancel("key")
+        await asyncio.sleep(WINDOW * 2)
+
+        self.assertEqual(self.coalescer.sent, 1)
+        self.assertFalse(self.coalescer.is_pending("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+
+from src.cogs.roster import Roster, RosterRegistry, SkillLevel
+
+
+class RosterParticipantsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.saved = []
+
+        async def save_roster_participant(roster, user_id):
+            self.saved.append(user_id)
+
+        self.cog = SimpleNamespace(rosters=RosterRegistry(), save_roster_participant=save_roster_participant)
+        self.roster = Roster(self.cog, "roster_1")
+        self.cog.rosters.add(self.roster)
+
+    def group_counts(self):
+        return {name: count for name, _, count in self.roster._group_fields()}
+
+    async def test_readd_with_a_different_skill_moves_the_participant(self):
+        user = SimpleNamespace(id=10, display_name="alice")
+        self.assertTrue(await self.roster.add_participant(user, SkillLevel.ROOKIE))
+        self.roster._group_fields()  # render, so the rookie fragment is cached
+        self.assertTrue(await self.roster.add_participant(user, SkillLevel.VETERAN))
+
+        self.assertEqual(self.roster.participants, {10: ("alice", SkillLevel.VETERAN)})
+        self.assertEqual(self.group_counts(), {f"{SkillLevel.VETERAN} (1)": 1})
+        self.assertEqual([roster.custom_id for roster in self.cog.rosters.for_user(10)], ["roster_1"])
+
+    async def test_readd_then_remove_leaves_no_ghost_entry(self):
+        user = SimpleNamespace(id=10, display_name="alice")
+        await self.roster.add_participant(user, SkillLevel.ROOKIE)
+        await self.roster.add_participant(user, SkillLevel.INTERMEDIATE)
+        self.roster._remove(10)
+
+        self.assertEqual(self.roster.participants, {})
+        self.assertEqual(self.roster._group_fields(), [])
+        self.assertEqual(self.cog.rosters.for_user(10), [])
+        self.assertEqual(self.roster.build_pages()[0].footer.text, "0 participant(s) • Page 1/1")
+
+
+if __name__ == "__main__":
+    unittest.main()
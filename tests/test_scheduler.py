@@ -0,0 +1,127 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.utils.scheduler import DeadlineScheduler
+
+
+class FakeClock:
+    # Time only moves when a test advances it
+    def __init__(self):
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+
+
+class DeadlineSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        self.batches = []
+
+        async def on_due(keys):
+            self.batches.append(keys)
+
+        self.scheduler = DeadlineScheduler(on_due, name="test", clock=self.clock)
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+
+    async def settle(self, seconds: float = 0.05):
+        # Let the scheduler loop run (real time; deadlines are judged by the fake clock)
+        await asyncio.sleep(seconds)
+
+    async def test_keys_due_together_fire_in_one_batch(self):
+        self.scheduler.schedule("a", self.clock.now)
+        self.scheduler.schedule("b", self.clock.now - timedelta(seconds=1))
+        self.scheduler.schedule("later", self.clock.now + timedelta(hours=1))
+        self.scheduler.start()
+        await self.settle()
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertCountEqual(self.batches[0], ["a", "b"])
+        self.assertEqual(self.scheduler.fired, 2)
+        self.assertEqual(self.scheduler.pending, 1)
+
+    async def test_fires_when_the_clock_reaches_the_deadline(self):
+        self.scheduler.schedule("a", self.clock.now + timedelta(seconds=0.02))
+        self.scheduler.start()
+        await asyncio.sleep(0)
+        self.assertEqual(self.batches, [])
+
+        self.clock.advance(0.02)
+        await self.settle()
+        self.assertEqual(self.batches, [["a"]])
+        self.assertEqual(self.scheduler.wakeups, 1)
+
+    async def test_rearming_earlier_wakes_the_loop_and_fires_once(self):
+        self.scheduler.schedule("a", self.clock.now + timedelta(hours=1))
+        self.scheduler.start()
+        await self.settle()
+        self.assertEqual(self.batches, [])
+
+        self.scheduler.schedule("a", self.clock.now)
+        await self.settle()
+        self.assertEqual(self.batches, [["a"]])
+
+        # The stale one-hour entry is dropped, not fired
+        self.clock.advance(7200)
+        self.assertIsNone(self.scheduler.next_deadline())
+        self.assertEqual(self.scheduler.fired, 1)
+
+    async def test_rearming_later_postpones(self):
+        self.scheduler.schedule("a", self.clock.now)
+        later = self.clock.now + timedelta(hours=1)
+        self.scheduler.schedule("a", later)
+        self.scheduler.start()
+        await self.settle()
+
+        self.assertEqual(self.batches, [])
+        self.assertEqual(self.scheduler.next_deadline(), later)
+
+    async def test_cancelled_keys_do_not_fire(self):
+        self.scheduler.schedule("a", self.clock.now)
+        self.scheduler.schedule("b", self.clock.now)
+        self.scheduler.cancel("a")
+        self.scheduler.cancel("missing")
+        self.scheduler.start()
+        await self.settle()
+
+        self.assertEqual(self.batches, [["b"]])
+        self.assertEqual(self.scheduler.pending, 0)
+
+    async def test_no_wakeups_while_idle(self):
+        self.scheduler.start()
+        await self.settle(0.1)
+        self.assertEqual(self.scheduler.wakeups, 0)
+
+        # Idle again after firing: only the schedule() wakeup is counted
+        self.scheduler.schedule("a", self.clock.now)
+        await self.settle()
+        self.assertEqual(self.batches, [["a"]])
+        wakeups = self.scheduler.wakeups
+        await self.settle(0.1)
+        self.assertEqual(self.scheduler.wakeups, wakeups)
+        self.assertLessEqual(wakeups, 1)
+
+    async def test_callback_errors_do_not_stop_the_loop(self):
+        async def on_due(keys):
+            self.batches.append(keys)
+            if "a" in keys:
+                raise RuntimeError("boom")
+
+        self.scheduler.on_due = on_due
+        self.scheduler.start()
+        with self.assertLogs("bot.scheduler", "ERROR"):
+            self.scheduler.schedule("a", self.clock.now)
+            await self.settle()
+        self.scheduler.schedule("b", self.clock.now)
+        await self.settle()
+        self.assertEqual(self.batches, [["a"], ["b"]])
+
+
+if __name__ == "__main__":
+    unittest.main()